@@ -0,0 +1,38 @@
+"""
+Registry for the active Canva API configuration
+Tools and the server look the configuration up here instead of importing
+it from another tool module
+"""
+
+from contextvars import ContextVar, Token
+
+from .models.canva_types import CanvaConfig
+
+# Process-wide configuration, filled in from the environment at startup
+_default_config = CanvaConfig(
+    client_id="",  # Will be loaded from environment
+    client_secret="",  # Will be loaded from environment
+    redirect_uri=""  # Will be loaded from environment
+)
+
+_config_var: ContextVar[CanvaConfig] = ContextVar("canva_config", default=_default_config)
+
+def get_config() -> CanvaConfig:
+    """Get the Canva configuration active in the current context"""
+    return _config_var.get()
+
+def set_config(config: CanvaConfig) -> Token:
+    """
+    Bind a Canva configuration to the current context.
+    
+    Args:
+        config: Configuration to use in this context
+        
+    Returns:
+        Token for restoring the previous configuration with reset_config
+    """
+    return _config_var.set(config)
+
+def reset_config(token: Token):
+    """Restore the configuration that was active before set_config"""
+    _config_var.reset(token)
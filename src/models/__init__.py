@@ -10,6 +10,7 @@ __all__ = [
     'CanvaConfig',
     'CanvaAuthResponse',
     'CanvaDesign',
+    'CanvaDesignBundle',
     'CanvaAsset',
     'CanvaFolder',
     'CanvaUser',
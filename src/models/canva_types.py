@@ -3,37 +3,54 @@ Canva-specific data types and models
 """
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Final, Literal, Dict, Any
 from datetime import datetime
-from enum import Enum
 
-class CanvaScope(str, Enum):
+class CanvaScope:
     """Canva API scopes"""
-    ASSET_READ = "asset:read"
-    ASSET_WRITE = "asset:write"
-    DESIGN_META_READ = "design:meta:read"
-    DESIGN_META_WRITE = "design:meta:write"
-    FOLDER_READ = "folder:read"
-    FOLDER_WRITE = "folder:write"
-    COMMENT_WRITE = "comment:write"
-    BRAND_TEMPLATE_READ = "brand_template:read"
-
-class CanvaFileType(str, Enum):
+    ASSET_READ: Final[str] = "asset:read"
+    ASSET_WRITE: Final[str] = "asset:write"
+    DESIGN_META_READ: Final[str] = "design:meta:read"
+    DESIGN_META_WRITE: Final[str] = "design:meta:write"
+    FOLDER_READ: Final[str] = "folder:read"
+    FOLDER_WRITE: Final[str] = "folder:write"
+    COMMENT_WRITE: Final[str] = "comment:write"
+    BRAND_TEMPLATE_READ: Final[str] = "brand_template:read"
+
+CanvaScopeT = Literal[
+    "asset:read",
+    "asset:write",
+    "design:meta:read",
+    "design:meta:write",
+    "folder:read",
+    "folder:write",
+    "comment:write",
+    "brand_template:read"
+]
+
+class CanvaFileType:
     """Supported file types for export"""
-    PDF = "pdf"
-    JPG = "jpg"
-    PNG = "png"
-    GIF = "gif"
-    PPTX = "pptx"
-    MP4 = "mp4"
-
-class CanvaJobStatus(str, Enum):
+    PDF: Final[str] = "pdf"
+    JPG: Final[str] = "jpg"
+    PNG: Final[str] = "png"
+    GIF: Final[str] = "gif"
+    PPTX: Final[str] = "pptx"
+    MP4: Final[str] = "mp4"
+
+CanvaFileTypeT = Literal["pdf", "jpg", "png", "gif", "pptx", "mp4"]
+
+class CanvaJobStatus:
     """Job status values"""
-    IN_PROGRESS = "in_progress"
-    SUCCESS = "success"
-    FAILED = "failed"
+    IN_PROGRESS: Final[str] = "in_progress"
+    SUCCESS: Final[str] = "success"
+    FAILED: Final[str] = "failed"
+    
+    # Statuses after which a job no longer changes
+    TERMINAL: Final[frozenset] = frozenset((SUCCESS, FAILED))
+
+CanvaJobStatusT = Literal["in_progress", "success", "failed"]
 
-@dataclass
+@dataclass(slots=True)
 class CanvaConfig:
     """Configuration for Canva API integration"""
     client_id: str
@@ -41,9 +58,9 @@ class CanvaConfig:
     redirect_uri: str
     access_token: Optional[str] = None
     refresh_token: Optional[str] = None
-    token_expires_at: Optional[datetime] = None
+    token_expires_at: Optional[float] = None  # time.monotonic() deadline
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CanvaAuthResponse:
     """OAuth authentication response"""
     access_token: str
@@ -52,7 +69,7 @@ class CanvaAuthResponse:
     scope: str
     refresh_token: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CanvaDesign:
     """Canva design information"""
     id: str
@@ -63,7 +80,14 @@ class CanvaDesign:
     folder_id: Optional[str] = None
     brand_kit_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class CanvaDesignBundle:
+    """Canva design metadata together with its pages and export formats"""
+    design: CanvaDesign
+    pages: Dict[str, Any]
+    export_formats: Dict[str, Any]
+
+@dataclass(slots=True, frozen=True)
 class CanvaAsset:
     """Canva asset information"""
     id: str
@@ -76,7 +100,7 @@ class CanvaAsset:
     folder_id: Optional[str] = None
     tags: Optional[List[str]] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CanvaFolder:
     """Canva folder information"""
     id: str
@@ -86,7 +110,7 @@ class CanvaFolder:
     parent_folder_id: Optional[str] = None
     item_count: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CanvaUser:
     """Canva user information"""
     id: str
@@ -95,7 +119,7 @@ class CanvaUser:
     email: Optional[str] = None
     team_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CanvaBrandTemplate:
     """Canva brand template information"""
     id: str
@@ -105,22 +129,22 @@ class CanvaBrandTemplate:
     description: Optional[str] = None
     has_dataset: bool = False
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CanvaExportJob:
     """Canva export job information"""
     id: str
-    status: CanvaJobStatus
-    file_type: CanvaFileType
+    status: CanvaJobStatusT
+    file_type: CanvaFileTypeT
     created_at: datetime
     completed_at: Optional[datetime] = None
     download_url: Optional[str] = None
     error_message: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CanvaUploadJob:
     """Canva upload job information"""
     id: str
-    status: CanvaJobStatus
+    status: CanvaJobStatusT
     filename: str
     file_size: int
     created_at: datetime
@@ -128,18 +152,18 @@ class CanvaUploadJob:
     asset_id: Optional[str] = None
     error_message: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CanvaAutofillJob:
     """Canva autofill job information"""
     id: str
-    status: CanvaJobStatus
+    status: CanvaJobStatusT
     brand_template_id: str
     created_at: datetime
     completed_at: Optional[datetime] = None
     design_id: Optional[str] = None
     error_message: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CanvaComment:
     """Canva comment information"""
     id: str
@@ -3,7 +3,7 @@ MCP-specific data types and models
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, TypedDict
 from enum import Enum
 
 class MCPToolCategory(str, Enum):
@@ -19,7 +19,7 @@ class MCPToolCategory(str, Enum):
     COMMENTS = "comments"
     UTILITY = "utility"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MCPTool:
     """MCP tool definition"""
     name: str
@@ -29,26 +29,29 @@ class MCPTool:
     parameters: Dict[str, Any]
     return_type: str
 
-@dataclass
-class MCPResponse:
-    """Standard MCP response format"""
+class _MCPResponseBase(TypedDict):
     success: bool
-    data: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
-    message: Optional[str] = None
 
-@dataclass
-class MCPError:
-    """MCP error information"""
+class MCPResponse(_MCPResponseBase, total=False):
+    """Standard MCP response format"""
+    data: Optional[Dict[str, Any]]
+    error: Optional[str]
+    message: Optional[str]
+
+class _MCPErrorBase(TypedDict):
     code: str
     message: str
-    details: Optional[Dict[str, Any]] = None
 
-@dataclass
-class MCPToolResult:
-    """Result from MCP tool execution"""
+class MCPError(_MCPErrorBase, total=False):
+    """MCP error information"""
+    details: Optional[Dict[str, Any]]
+
+class _MCPToolResultBase(TypedDict):
     tool_name: str
     success: bool
     duration: float
-    result: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None 
\ No newline at end of file
+
+class MCPToolResult(_MCPToolResultBase, total=False):
+    """Result from MCP tool execution"""
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
\ No newline at end of file
@@ -3,15 +3,22 @@ Canva MCP Server - Main Server File
 Refactored version with organized structure
 """
 
+import asyncio
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
 from src.utils.logging import log_server_startup, log_server_shutdown, logger
-from src.tools.auth_tools import canva_config as auth_config
+from src.config_registry import get_config
+from src.services.base_service import BaseService
+from src.services.http_client import close_shared_client
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from the project's .env file, if there is one;
+# DOTENV_SKIP=1 skips it where the variables are already injected
+_ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+if os.getenv("DOTENV_SKIP") != "1" and _ENV_FILE.exists():
+    load_dotenv(_ENV_FILE)
 
 # Initialize MCP server
 mcp = FastMCP(
@@ -21,135 +28,47 @@ mcp = FastMCP(
 
 def setup_configuration():
     """Setup configuration from environment variables"""
-    auth_config.client_id = os.getenv("CANVA_CLIENT_ID", "")
-    auth_config.client_secret = os.getenv("CANVA_CLIENT_SECRET", "")
-    auth_config.redirect_uri = os.getenv("CANVA_REDIRECT_URI", "")
+    env = os.environ
+    auth_config = get_config()
+    auth_config.client_id = env.get("CANVA_CLIENT_ID", "")
+    auth_config.client_secret = env.get("CANVA_CLIENT_SECRET", "")
+    auth_config.redirect_uri = env.get("CANVA_REDIRECT_URI", "")
+
+def install_event_loop():
+    """Run the server on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+async def serve():
+    """Run the SSE server, closing pooled connections in the loop that opened them"""
+    # Warm the Canva API connection pool in the background; the server
+    # starts accepting sessions without waiting on it
+    warmup = asyncio.create_task(BaseService(get_config()).warmup())
+    try:
+        await mcp.run_sse_async()
+    finally:
+        warmup.cancel()
+        await close_shared_client()
 
 def register_tools():
     """Register all MCP tools"""
-    from src.tools import (
-        # Auth tools
-        create_authorization_url,
-        exchange_code_for_token,
-        refresh_access_token,
-        get_oauth_config,
-        clear_tokens,
-        
-        # User tools
-        get_current_user,
-        get_user_profile,
-        get_user_capabilities,
-        
-        # Design tools
-        create_design,
-        list_designs,
-        get_design,
-        get_design_pages,
-        get_design_export_formats,
-        
-        # Asset tools
-        create_asset_upload_job,
-        get_asset_upload_job,
-        create_url_asset_upload_job,
-        get_url_asset_upload_job,
-        get_asset,
-        update_asset,
-        delete_asset,
-        
-        # Folder tools
-        create_folder,
-        get_folder,
-        update_folder,
-        delete_folder,
-        list_folder_items,
-        move_folder_item,
-        
-        # Export tools
-        create_design_export_job,
-        get_design_export_job,
-        
-        # Brand template tools
-        list_brand_templates,
-        get_brand_template,
-        get_brand_template_dataset,
-        
-        # Autofill tools
-        create_design_autofill_job,
-        get_design_autofill_job,
-        
-        # Comment tools
-        create_comment_thread,
-        create_comment_reply,
-        get_comment_thread,
-        list_comment_replies,
-    )
-    
-    # Register all tools with the MCP server
-    tools = [
-        # Auth tools
-        create_authorization_url,
-        exchange_code_for_token,
-        refresh_access_token,
-        get_oauth_config,
-        clear_tokens,
-        
-        # User tools
-        get_current_user,
-        get_user_profile,
-        get_user_capabilities,
-        
-        # Design tools
-        create_design,
-        list_designs,
-        get_design,
-        get_design_pages,
-        get_design_export_formats,
-        
-        # Asset tools
-        create_asset_upload_job,
-        get_asset_upload_job,
-        create_url_asset_upload_job,
-        get_url_asset_upload_job,
-        get_asset,
-        update_asset,
-        delete_asset,
-        
-        # Folder tools
-        create_folder,
-        get_folder,
-        update_folder,
-        delete_folder,
-        list_folder_items,
-        move_folder_item,
-        
-        # Export tools
-        create_design_export_job,
-        get_design_export_job,
-        
-        # Brand template tools
-        list_brand_templates,
-        get_brand_template,
-        get_brand_template_dataset,
-        
-        # Autofill tools
-        create_design_autofill_job,
-        get_design_autofill_job,
-        
-        # Comment tools
-        create_comment_thread,
-        create_comment_reply,
-        get_comment_thread,
-        list_comment_replies,
-    ]
+    from src import tools
     
-    for tool in tools:
-        mcp.tool()(tool)
+    # src.tools.__all__ is the single list of exposed tools
+    for name in tools.__all__:
+        mcp.tool()(getattr(tools, name))
 
 def main():
     """Main server function"""
     try:
         # Setup configuration
         setup_configuration()
+        install_event_loop()
         
         # Log server startup
         log_server_startup()
@@ -159,7 +78,7 @@ def main():
         
         # Start the server with SSE transport
         logger.info("Starting Canva MCP Server with SSE transport...")
-        mcp.run(transport="sse")
+        asyncio.run(serve())
         
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
@@ -4,14 +4,76 @@ Handles asset upload, management, and operations
 """
 
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+
+import httpx
 
 from .base_service import BaseService
-from ..models.canva_types import CanvaConfig, CanvaAsset, CanvaUploadJob
+from .cache import PendingJobCache, TTLCache
+from ..models.canva_types import CanvaConfig, CanvaAsset, CanvaUploadJob, CanvaJobStatus
+from ..utils.dates import parse_iso, parse_iso_opt
 
 class AssetService(BaseService):
     """Service for handling asset-related operations"""
     
+    def __init__(self, config: CanvaConfig, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(config, client)
+        # Asset metadata, invalidated on update/delete
+        self._asset_cache = TTLCache(maxsize=1024, ttl=300)
+        # Upload jobs that reached a terminal status and can no longer change
+        self._job_cache = TTLCache(maxsize=1024)
+        # Upload jobs still running, refetched with a growing backoff
+        self._pending_jobs = PendingJobCache()
+    
+    @staticmethod
+    def _upload_job_from(
+        job: Dict[str, Any],
+        filename: Optional[str] = None,
+        file_size: Optional[int] = None
+    ) -> CanvaUploadJob:
+        """Build an upload job from the API job payload"""
+        return CanvaUploadJob(
+            id=job["id"],
+            status=job["status"],
+            filename=filename if filename is not None else job["filename"],
+            file_size=file_size if file_size is not None else job.get("file_size", 0),
+            created_at=parse_iso(job["created_at"]),
+            completed_at=parse_iso_opt(job.get("completed_at")),
+            asset_id=job.get("asset_id"),
+            error_message=job.get("error_message")
+        )
+    
+    @staticmethod
+    def _asset_from(asset: Dict[str, Any]) -> CanvaAsset:
+        """Build an asset from the API asset payload"""
+        return CanvaAsset(
+            id=asset["id"],
+            title=asset["title"],
+            filename=asset["filename"],
+            file_size=asset["file_size"],
+            mime_type=asset["mime_type"],
+            created_at=parse_iso(asset["created_at"]),
+            updated_at=parse_iso(asset["updated_at"]),
+            folder_id=asset.get("folder_id"),
+            tags=asset.get("tags")
+        )
+    
+    def _track_job(self, key: tuple, job: CanvaUploadJob) -> CanvaUploadJob:
+        """Cache a fetched upload job according to its status"""
+        if job.status in CanvaJobStatus.TERMINAL:
+            self._pending_jobs.discard(key)
+            self._job_cache.set(key, job)
+        else:
+            self._pending_jobs.record(key, job)
+        return job
+    
+    def upload_job_poll_interval(self, job_id: str) -> Optional[float]:
+        """Suggested seconds before polling a running upload job again"""
+        return self._pending_jobs.poll_interval(self._token_key("upload", job_id))
+    
+    def url_upload_job_poll_interval(self, job_id: str) -> Optional[float]:
+        """Suggested seconds before polling a running URL upload job again"""
+        return self._pending_jobs.poll_interval(self._token_key("url", job_id))
+    
     async def create_asset_upload_job(
         self,
         filename: str,
@@ -37,17 +99,7 @@ class AssetService(BaseService):
             data["folder_id"] = folder_id
         
         response = await self.post("/assets/upload", data=data)
-        
-        return CanvaUploadJob(
-            id=response["job"]["id"],
-            status=response["job"]["status"],
-            filename=filename,
-            file_size=file_size,
-            created_at=datetime.fromisoformat(response["job"]["created_at"].replace("Z", "+00:00")),
-            completed_at=datetime.fromisoformat(response["job"]["completed_at"].replace("Z", "+00:00")) if response["job"].get("completed_at") else None,
-            asset_id=response["job"].get("asset_id"),
-            error_message=response["job"].get("error_message")
-        )
+        return self._upload_job_from(response["job"], filename=filename, file_size=file_size)
     
     async def get_asset_upload_job(self, job_id: str) -> CanvaUploadJob:
         """
@@ -59,18 +111,15 @@ class AssetService(BaseService):
         Returns:
             Upload job status and results
         """
-        response = await self.get(f"/assets/upload/{job_id}")
+        key = self._token_key("upload", job_id)
+        cached = self._job_cache.get(key)
+        if cached is None:
+            cached = self._pending_jobs.get(key)
+        if cached is not None:
+            return cached
         
-        return CanvaUploadJob(
-            id=response["job"]["id"],
-            status=response["job"]["status"],
-            filename=response["job"]["filename"],
-            file_size=response["job"]["file_size"],
-            created_at=datetime.fromisoformat(response["job"]["created_at"].replace("Z", "+00:00")),
-            completed_at=datetime.fromisoformat(response["job"]["completed_at"].replace("Z", "+00:00")) if response["job"].get("completed_at") else None,
-            asset_id=response["job"].get("asset_id"),
-            error_message=response["job"].get("error_message")
-        )
+        response = await self.get(f"/assets/upload/{job_id}")
+        return self._track_job(key, self._upload_job_from(response["job"]))
     
     async def create_url_asset_upload_job(
         self,
@@ -97,17 +146,8 @@ class AssetService(BaseService):
             data["folder_id"] = folder_id
         
         response = await self.post("/assets/upload/url", data=data)
-        
-        return CanvaUploadJob(
-            id=response["job"]["id"],
-            status=response["job"]["status"],
-            filename=filename,
-            file_size=0,  # Will be determined during upload
-            created_at=datetime.fromisoformat(response["job"]["created_at"].replace("Z", "+00:00")),
-            completed_at=datetime.fromisoformat(response["job"]["completed_at"].replace("Z", "+00:00")) if response["job"].get("completed_at") else None,
-            asset_id=response["job"].get("asset_id"),
-            error_message=response["job"].get("error_message")
-        )
+        # File size will be determined during upload
+        return self._upload_job_from(response["job"], filename=filename, file_size=0)
     
     async def get_url_asset_upload_job(self, job_id: str) -> CanvaUploadJob:
         """
@@ -119,18 +159,15 @@ class AssetService(BaseService):
         Returns:
             Upload job status and results
         """
-        response = await self.get(f"/assets/upload/url/{job_id}")
+        key = self._token_key("url", job_id)
+        cached = self._job_cache.get(key)
+        if cached is None:
+            cached = self._pending_jobs.get(key)
+        if cached is not None:
+            return cached
         
-        return CanvaUploadJob(
-            id=response["job"]["id"],
-            status=response["job"]["status"],
-            filename=response["job"]["filename"],
-            file_size=response["job"].get("file_size", 0),
-            created_at=datetime.fromisoformat(response["job"]["created_at"].replace("Z", "+00:00")),
-            completed_at=datetime.fromisoformat(response["job"]["completed_at"].replace("Z", "+00:00")) if response["job"].get("completed_at") else None,
-            asset_id=response["job"].get("asset_id"),
-            error_message=response["job"].get("error_message")
-        )
+        response = await self.get(f"/assets/upload/url/{job_id}")
+        return self._track_job(key, self._upload_job_from(response["job"]))
     
     async def get_asset(self, asset_id: str) -> CanvaAsset:
         """
@@ -142,19 +179,15 @@ class AssetService(BaseService):
         Returns:
             Asset metadata
         """
-        response = await self.get(f"/assets/{asset_id}")
+        key = self._token_key(asset_id)
+        cached = self._asset_cache.get(key)
+        if cached is not None:
+            return cached
         
-        return CanvaAsset(
-            id=response["asset"]["id"],
-            title=response["asset"]["title"],
-            filename=response["asset"]["filename"],
-            file_size=response["asset"]["file_size"],
-            mime_type=response["asset"]["mime_type"],
-            created_at=datetime.fromisoformat(response["asset"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["asset"]["updated_at"].replace("Z", "+00:00")),
-            folder_id=response["asset"].get("folder_id"),
-            tags=response["asset"].get("tags")
-        )
+        response = await self.get(f"/assets/{asset_id}")
+        asset = self._asset_from(response["asset"])
+        self._asset_cache.set(key, asset)
+        return asset
     
     async def update_asset(
         self,
@@ -173,25 +206,18 @@ class AssetService(BaseService):
         Returns:
             Updated asset information
         """
-        data = {}
+        data: Dict[str, Any] = {}
         if title:
             data["title"] = title
         if tags:
             data["tags"] = tags
+        if not data:
+            raise ValueError("update_asset requires at least one of title or tags")
         
         response = await self.patch(f"/assets/{asset_id}", data=data)
-        
-        return CanvaAsset(
-            id=response["asset"]["id"],
-            title=response["asset"]["title"],
-            filename=response["asset"]["filename"],
-            file_size=response["asset"]["file_size"],
-            mime_type=response["asset"]["mime_type"],
-            created_at=datetime.fromisoformat(response["asset"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["asset"]["updated_at"].replace("Z", "+00:00")),
-            folder_id=response["asset"].get("folder_id"),
-            tags=response["asset"].get("tags")
-        )
+        asset = self._asset_from(response["asset"])
+        self._asset_cache.set(self._token_key(asset_id), asset)
+        return asset
     
     async def delete_asset(self, asset_id: str) -> Dict[str, Any]:
         """
@@ -203,4 +229,5 @@ class AssetService(BaseService):
         Returns:
             Deletion confirmation
         """
+        self._asset_cache.invalidate(self._token_key(asset_id))
         return await self.delete(f"/assets/{asset_id}") 
\ No newline at end of file
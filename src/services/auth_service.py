@@ -3,40 +3,74 @@ Authentication service for Canva API
 Handles OAuth 2.0 flow and token management
 """
 
+import asyncio
 import base64
+import dataclasses
 import hashlib
 import secrets
 import time
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Optional
+from urllib.parse import urlencode
 
 import httpx
 
+from .http_client import CANVA_API_BASE, get_shared_client
 from ..models.canva_types import CanvaConfig, CanvaAuthResponse, CanvaScope
-from ..utils.logging import logger, log_oauth_flow, log_api_request
+from ..utils.logging import log_oauth_flow, log_api_request
+from ..utils.serialization import json_loads
+
+# A token with more than this many seconds left is not refreshed
+_REFRESH_GRACE_SECONDS = 60
+
+# Scopes requested when the caller does not specify any
+_DEFAULT_SCOPES = " ".join((
+    CanvaScope.ASSET_READ,
+    CanvaScope.ASSET_WRITE,
+    CanvaScope.DESIGN_META_READ,
+    CanvaScope.FOLDER_READ
+))
 
 class AuthService:
     """Service for handling Canva API authentication"""
     
-    def __init__(self, config: CanvaConfig):
+    _TOKEN_PATH = "/oauth/token"
+    _FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+    
+    def __init__(self, config: CanvaConfig, client: Optional[httpx.AsyncClient] = None):
         self.config = config
-        self.api_base = "https://api.canva.com/rest/v1"
+        # Client injected by the caller, who owns it; None uses the shared client
+        self._client = client
+        self.api_base = CANVA_API_BASE
         self.auth_base = "https://www.canva.com/api/oauth"
+        self._basic_auth_header: Optional[str] = None
+        # Last token response, returned again while its token is still fresh
+        self._token_response: Optional[CanvaAuthResponse] = None
+        # Serializes refreshes so concurrent callers share one round trip
+        self._refresh_lock = asyncio.Lock()
+    
+    def _basic_auth(self) -> str:
+        """Get the Basic authorization header for the client credentials"""
+        if self._basic_auth_header is None:
+            credentials = base64.b64encode(
+                f"{self.config.client_id}:{self.config.client_secret}".encode()
+            ).decode()
+            self._basic_auth_header = f"Basic {credentials}"
+        return self._basic_auth_header
     
     def generate_code_verifier(self) -> str:
         """Generate a code verifier for PKCE"""
-        return base64.urlsafe_b64encode(secrets.token_bytes(96)).decode('utf-8').rstrip('=')
+        return secrets.token_urlsafe(32)
     
     def generate_code_challenge(self, code_verifier: str) -> str:
         """Generate a code challenge from code verifier"""
         sha256_hash = hashlib.sha256(code_verifier.encode('utf-8')).digest()
-        return base64.urlsafe_b64encode(sha256_hash).decode('utf-8').rstrip('=')
+        return base64.urlsafe_b64encode(sha256_hash).rstrip(b'=').decode('ascii')
     
     def generate_state(self) -> str:
         """Generate a state parameter for OAuth"""
-        return base64.urlsafe_b64encode(secrets.token_bytes(96)).decode('utf-8').rstrip('=')
+        return secrets.token_urlsafe(32)
     
-    def create_authorization_url(self, scopes: str = None) -> Dict[str, str]:
+    def create_authorization_url(self, scopes: Optional[str] = None) -> Dict[str, str]:
         """
         Create an OAuth authorization URL for Canva API access.
         
@@ -49,28 +83,22 @@ class AuthService:
         if not self.config.client_id:
             raise Exception("CANVA_CLIENT_ID not configured")
         
-        if scopes is None:
-            scopes = " ".join([
-                CanvaScope.ASSET_READ.value,
-                CanvaScope.ASSET_WRITE.value,
-                CanvaScope.DESIGN_META_READ.value,
-                CanvaScope.FOLDER_READ.value
-            ])
+        scopes = scopes or _DEFAULT_SCOPES
         
         code_verifier = self.generate_code_verifier()
         code_challenge = self.generate_code_challenge(code_verifier)
         state = self.generate_state()
         
-        auth_url = (
-            f"{self.auth_base}/authorize?"
-            f"code_challenge={code_challenge}&"
-            f"code_challenge_method=s256&"
-            f"scope={scopes}&"
-            f"response_type=code&"
-            f"client_id={self.config.client_id}&"
-            f"state={state}&"
-            f"redirect_uri={self.config.redirect_uri}"
-        )
+        params = {
+            "code_challenge": code_challenge,
+            "code_challenge_method": "s256",
+            "scope": scopes,
+            "response_type": "code",
+            "client_id": self.config.client_id,
+            "state": state,
+            "redirect_uri": self.config.redirect_uri
+        }
+        auth_url = f"{self.auth_base}/authorize?{urlencode(params)}"
         
         log_oauth_flow("Authorization URL created", {
             "scopes": scopes,
@@ -97,13 +125,9 @@ class AuthService:
         if not self.config.client_id or not self.config.client_secret:
             raise Exception("CANVA_CLIENT_ID and CANVA_CLIENT_SECRET must be configured")
         
-        credentials = base64.b64encode(
-            f"{self.config.client_id}:{self.config.client_secret}".encode()
-        ).decode()
-        
         headers = {
-            "Authorization": f"Basic {credentials}",
-            "Content-Type": "application/x-www-form-urlencoded"
+            "Authorization": self._basic_auth(),
+            "Content-Type": self._FORM_CONTENT_TYPE
         }
         
         data = {
@@ -113,58 +137,85 @@ class AuthService:
             "redirect_uri": self.config.redirect_uri
         }
         
-        start_time = time.time()
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_base}/oauth/token",
-                headers=headers,
-                data=data
-            )
-            duration = time.time() - start_time
+        start_time = time.perf_counter()
+        client = self._client or get_shared_client()
+        response = await client.post(self._TOKEN_PATH, headers=headers, data=data)
+        duration = time.perf_counter() - start_time
         
-        log_api_request("POST", "/oauth/token", response.status_code, duration)
+        log_api_request("POST", self._TOKEN_PATH, response.status_code, duration)
         
         if response.status_code >= 400:
-            error_detail = response.json() if response.content else {}
+            error_detail = json_loads(response.content) if response.content else {}
             raise Exception(f"Token exchange failed: {response.status_code} - {error_detail}")
         
-        response_data = response.json()
+        response_data = json_loads(response.content)
         
         # Update stored tokens
         self.config.access_token = response_data.get("access_token")
         self.config.refresh_token = response_data.get("refresh_token")
-        self.config.token_expires_at = datetime.now() + timedelta(seconds=response_data.get("expires_in", 3600))
+        self.config.token_expires_at = time.monotonic() + response_data.get("expires_in", 3600)
         
         log_oauth_flow("Token exchange successful", {
             "expires_in": response_data.get("expires_in"),
             "scope": response_data.get("scope")
         })
         
-        return CanvaAuthResponse(
+        self._token_response = CanvaAuthResponse(
             access_token=response_data["access_token"],
             token_type=response_data["token_type"],
             expires_in=response_data["expires_in"],
             scope=response_data["scope"],
             refresh_token=response_data["refresh_token"]
         )
+        return self._token_response
+    
+    def _fresh_token_response(self) -> Optional[CanvaAuthResponse]:
+        """
+        Get the last token response if its token is still current and valid
+        for longer than the refresh grace window.
+        
+        Returns:
+            Token response with expires_in set to the remaining lifetime, or None
+        """
+        response = self._token_response
+        expires_at = self.config.token_expires_at
+        if response is None or expires_at is None or response.access_token != self.config.access_token:
+            return None
+        
+        remaining = expires_at - time.monotonic()
+        if remaining <= _REFRESH_GRACE_SECONDS:
+            return None
+        return dataclasses.replace(response, expires_in=int(remaining))
     
     async def refresh_access_token(self) -> CanvaAuthResponse:
         """
         Refresh the access token using the refresh token.
         
+        The current token is returned without a round trip while it has more
+        than a minute left, and concurrent calls share a single refresh.
+        
         Returns:
-            New token response
+            New (or still valid) token response
         """
+        response = self._fresh_token_response()
+        if response is not None:
+            return response
+        
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            response = self._fresh_token_response()
+            if response is not None:
+                return response
+            return await self._request_token_refresh()
+    
+    async def _request_token_refresh(self) -> CanvaAuthResponse:
+        """Exchange the refresh token for a new access token"""
         if not self.config.refresh_token:
             raise Exception("No refresh token available")
         
-        credentials = base64.b64encode(
-            f"{self.config.client_id}:{self.config.client_secret}".encode()
-        ).decode()
-        
         headers = {
-            "Authorization": f"Basic {credentials}",
-            "Content-Type": "application/x-www-form-urlencoded"
+            "Authorization": self._basic_auth(),
+            "Content-Type": self._FORM_CONTENT_TYPE
         }
         
         data = {
@@ -172,51 +223,49 @@ class AuthService:
             "refresh_token": self.config.refresh_token
         }
         
-        start_time = time.time()
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_base}/oauth/token",
-                headers=headers,
-                data=data
-            )
-            duration = time.time() - start_time
+        start_time = time.perf_counter()
+        client = self._client or get_shared_client()
+        response = await client.post(self._TOKEN_PATH, headers=headers, data=data)
+        duration = time.perf_counter() - start_time
         
-        log_api_request("POST", "/oauth/token", response.status_code, duration)
+        log_api_request("POST", self._TOKEN_PATH, response.status_code, duration)
         
         if response.status_code >= 400:
-            error_detail = response.json() if response.content else {}
+            error_detail = json_loads(response.content) if response.content else {}
             raise Exception(f"Token refresh failed: {response.status_code} - {error_detail}")
         
-        response_data = response.json()
+        response_data = json_loads(response.content)
         
         # Update stored tokens
         self.config.access_token = response_data.get("access_token")
         self.config.refresh_token = response_data.get("refresh_token")
-        self.config.token_expires_at = datetime.now() + timedelta(seconds=response_data.get("expires_in", 3600))
+        self.config.token_expires_at = time.monotonic() + response_data.get("expires_in", 3600)
         
         log_oauth_flow("Token refresh successful", {
             "expires_in": response_data.get("expires_in")
         })
         
-        return CanvaAuthResponse(
+        self._token_response = CanvaAuthResponse(
             access_token=response_data["access_token"],
             token_type=response_data["token_type"],
             expires_in=response_data["expires_in"],
             scope=response_data["scope"],
             refresh_token=response_data["refresh_token"]
         )
+        return self._token_response
     
     def is_token_expired(self) -> bool:
         """Check if the current access token is expired"""
-        if not self.config.token_expires_at:
+        if self.config.token_expires_at is None:
             return True
-        return datetime.now() >= self.config.token_expires_at
+        return time.monotonic() >= self.config.token_expires_at
     
     def clear_tokens(self):
         """Clear stored access and refresh tokens"""
         self.config.access_token = None
         self.config.refresh_token = None
         self.config.token_expires_at = None
+        self._token_response = None
         log_oauth_flow("Tokens cleared")
     
     def get_auth_headers(self) -> Dict[str, str]:
@@ -3,15 +3,38 @@ Autofill service for Canva API
 Handles design autofill operations
 """
 
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, Optional
+
+import httpx
 
 from .base_service import BaseService
-from ..models.canva_types import CanvaConfig, CanvaAutofillJob
+from .cache import PendingJobCache, TTLCache
+from ..models.canva_types import CanvaConfig, CanvaAutofillJob, CanvaJobStatus
+from ..utils.dates import parse_iso, parse_iso_opt
 
 class AutofillService(BaseService):
     """Service for handling autofill operations"""
     
+    def __init__(self, config: CanvaConfig, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(config, client)
+        # Autofill jobs that reached a terminal status and can no longer change
+        self._job_cache = TTLCache(maxsize=1024)
+        # Autofill jobs still running, refetched with a growing backoff
+        self._pending_jobs = PendingJobCache()
+    
+    @staticmethod
+    def _autofill_job_from(job: Dict[str, Any], brand_template_id: Optional[str] = None) -> CanvaAutofillJob:
+        """Build an autofill job from the API job payload"""
+        return CanvaAutofillJob(
+            id=job["id"],
+            status=job["status"],
+            brand_template_id=brand_template_id if brand_template_id is not None else job["brand_template_id"],
+            created_at=parse_iso(job["created_at"]),
+            completed_at=parse_iso_opt(job.get("completed_at")),
+            design_id=job.get("design_id"),
+            error_message=job.get("error_message")
+        )
+    
     async def create_design_autofill_job(
         self,
         brand_template_id: str,
@@ -33,16 +56,7 @@ class AutofillService(BaseService):
         }
         
         response = await self.post("/autofills", data=data)
-        
-        return CanvaAutofillJob(
-            id=response["job"]["id"],
-            status=response["job"]["status"],
-            brand_template_id=brand_template_id,
-            created_at=datetime.fromisoformat(response["job"]["created_at"].replace("Z", "+00:00")),
-            completed_at=datetime.fromisoformat(response["job"]["completed_at"].replace("Z", "+00:00")) if response["job"].get("completed_at") else None,
-            design_id=response["job"].get("design_id"),
-            error_message=response["job"].get("error_message")
-        )
+        return self._autofill_job_from(response["job"], brand_template_id=brand_template_id)
     
     async def get_design_autofill_job(self, job_id: str) -> CanvaAutofillJob:
         """
@@ -54,14 +68,22 @@ class AutofillService(BaseService):
         Returns:
             Autofill job status and results
         """
-        response = await self.get(f"/autofills/{job_id}")
+        key = self._token_key(job_id)
+        cached = self._job_cache.get(key)
+        if cached is None:
+            cached = self._pending_jobs.get(key)
+        if cached is not None:
+            return cached
         
-        return CanvaAutofillJob(
-            id=response["job"]["id"],
-            status=response["job"]["status"],
-            brand_template_id=response["job"]["brand_template_id"],
-            created_at=datetime.fromisoformat(response["job"]["created_at"].replace("Z", "+00:00")),
-            completed_at=datetime.fromisoformat(response["job"]["completed_at"].replace("Z", "+00:00")) if response["job"].get("completed_at") else None,
-            design_id=response["job"].get("design_id"),
-            error_message=response["job"].get("error_message")
-        ) 
\ No newline at end of file
+        response = await self.get(f"/autofills/{job_id}")
+        result = self._autofill_job_from(response["job"])
+        if result.status in CanvaJobStatus.TERMINAL:
+            self._pending_jobs.discard(key)
+            self._job_cache.set(key, result)
+        else:
+            self._pending_jobs.record(key, result)
+        return result
+    
+    def autofill_job_poll_interval(self, job_id: str) -> Optional[float]:
+        """Suggested seconds before polling a running autofill job again"""
+        return self._pending_jobs.poll_interval(self._token_key(job_id))
\ No newline at end of file
@@ -2,19 +2,138 @@
 Base service for common HTTP operations
 """
 
+import asyncio
+import random
 import time
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Hashable, Optional, List, Mapping, Tuple, AsyncIterator
 import httpx
 
+from .cache import TTLCache
+from .http_client import CANVA_API_BASE, get_shared_client
 from ..models.canva_types import CanvaConfig
-from ..utils.logging import log_api_request
+from ..utils.errors import CanvaAPIError
+from ..utils.logging import api_logging_enabled, log_api_request, logger
+from ..utils.serialization import json_dumps, json_loads
+
+# Short-lived GET responses shared by all services, keyed per access token
+_response_cache = TTLCache(maxsize=256)
+
+# Responses retried in place instead of failing the tool call
+_RETRY_STATUSES = frozenset((429, 502, 503, 504))
+# Server errors are only retried for requests that are safe to repeat
+_IDEMPOTENT_METHODS = frozenset(("GET", "DELETE"))
+_MAX_RETRIES = 3
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+
+# Whether the shared connection pool has been warmed up in this process
+_warmed_up = False
+
+# Seconds read-only GETs are cached for, so an agent re-reading the same
+# resource within one workflow step does not hit the API again
+SHORT_CACHE_TTL = 3
+
+# Response field holding the token for the next page of a listing
+NEXT_PAGE_TOKEN = "next_page_token"
+# Response field holding the items of a listing page
+PAGE_ITEMS = "items"
+
+DEFAULT_PAGE_LIMIT = 50
+# Query parameters of a first page with the default limit, shared by all calls
+_DEFAULT_PAGE_PARAMS: Mapping[str, Any] = MappingProxyType({"limit": DEFAULT_PAGE_LIMIT})
+
+def page_params(limit: int, page_token: Optional[str] = None) -> Mapping[str, Any]:
+    """
+    Build the query parameters for one page of a listing
+    
+    Args:
+        limit: Maximum number of items to return
+        page_token: Token for pagination
+        
+    Returns:
+        Query parameters; the common first-page case reuses a shared,
+        read-only mapping instead of allocating a new dict
+    """
+    if page_token:
+        return {"limit": limit, "page_token": page_token}
+    if limit == DEFAULT_PAGE_LIMIT:
+        return _DEFAULT_PAGE_PARAMS
+    return {"limit": limit}
+
+class _InflightRequest:
+    """A GET request in flight and the number of callers awaiting it"""
+    
+    __slots__ = ("future", "waiters")
+    
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.waiters = 0
 
 class BaseService:
     """Base service for common HTTP operations"""
     
-    def __init__(self, config: CanvaConfig):
+    def __init__(self, config: CanvaConfig, client: Optional[httpx.AsyncClient] = None):
         self.config = config
-        self.api_base = "https://api.canva.com/rest/v1"
+        self.api_base = CANVA_API_BASE
+        # Client injected by the caller, who owns it; None uses the shared client
+        self._client = client
+        # Authorization headers for the current access token, rebuilt when it changes
+        self._auth_token: Optional[str] = None
+        self._auth_headers: Dict[str, str] = {}
+        # In-flight GET requests, shared by concurrent identical calls
+        self._inflight: Dict[Tuple, _InflightRequest] = {}
+    
+    def _token_key(self, *parts: Hashable) -> Tuple:
+        """Cache key scoped to the current access token, so entries cached
+        for one identity are never served after the token changes"""
+        return (self.config.access_token, *parts)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client for this service (the shared one unless injected)"""
+        if self._client is not None:
+            return self._client
+        return get_shared_client()
+    
+    def _get_auth_headers(self) -> Dict[str, str]:
+        """Get the authorization headers for the current access token"""
+        token = self.config.access_token
+        if token != self._auth_token:
+            self._auth_token = token
+            self._auth_headers = {"Authorization": f"Bearer {token}"} if token else {}
+        return self._auth_headers
+    
+    async def close(self):
+        """
+        Release the service. The HTTP client is left open: the shared client
+        is used by every service and closed by server.serve(), and an
+        injected client is closed by whoever created it.
+        """
+    
+    async def warmup(self):
+        """
+        Open a connection to the Canva API before the first real request,
+        so the TLS handshake is not paid by the first tool call.
+        Failures are ignored: the handshake is all that matters here, and
+        it is attempted only once per process.
+        """
+        global _warmed_up
+        if _warmed_up:
+            return
+        _warmed_up = True
+        
+        try:
+            response = await self._get_client().get("/users/me", headers=self._get_auth_headers())
+            # HTTP/2 is only negotiated when h2 is installed
+            logger.info("Canva API connection warmed up over %s", response.http_version)
+        except httpx.HTTPError as e:
+            logger.debug("Connection warmup failed: %s", e)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
     
     async def make_request(
         self,
@@ -22,7 +141,7 @@ class BaseService:
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Mapping[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Make a request to the Canva API
@@ -37,37 +156,205 @@ class BaseService:
         Returns:
             API response data
         """
-        if headers is None:
-            headers = {}
-        
         # Add authentication header if token is available
-        if self.config.access_token:
-            headers['Authorization'] = f'Bearer {self.config.access_token}'
+        auth_headers = self._get_auth_headers()
+        headers = {**headers, **auth_headers} if headers else auth_headers
         
-        url = f"{self.api_base}{endpoint}"
+        # Encode the body once, up front, rather than through httpx's json= path
+        content = None
+        if data:
+            content = json_dumps(data)
+            headers = {**headers, "Content-Type": "application/json"}
         
-        start_time = time.time()
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
+        attempt = 0
+        while True:
+            # Requests are only timed when successful requests are logged;
+            # redirects and failures are logged either way
+            timed = api_logging_enabled()
+            start_time = time.perf_counter() if timed else 0.0
+            response = await self._get_client().request(
                 method=method,
-                url=url,
+                url=endpoint,
                 headers=headers,
-                json=data if data else None,
+                content=content,
                 params=params
             )
-            duration = time.time() - start_time
-        
-        log_api_request(method, endpoint, response.status_code, duration)
+            if timed:
+                log_api_request(method, endpoint, response.status_code, time.perf_counter() - start_time)
+            elif response.status_code >= 300:
+                log_api_request(method, endpoint, response.status_code)
+            
+            if attempt >= _MAX_RETRIES or not self._should_retry(method, response.status_code):
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
+            attempt += 1
         
+        payload = json_loads(response.content) if response.content else {}
         if response.status_code >= 400:
-            error_detail = response.json() if response.content else {}
-            raise Exception(f"Canva API error: {response.status_code} - {error_detail}")
+            raise CanvaAPIError(response.status_code, payload)
         
-        return response.json() if response.content else {}
+        return payload
+    
+    @staticmethod
+    def _should_retry(method: str, status_code: int) -> bool:
+        """Whether a response status is transient and the request can be repeated"""
+        if status_code == 429:
+            # Rate-limited requests were not processed, whatever the method
+            return True
+        return status_code in _RETRY_STATUSES and method in _IDEMPOTENT_METHODS
+    
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a request
+        
+        Honours a Retry-After header given in seconds, otherwise backs off
+        exponentially; jitter keeps concurrent retries from lining up.
+        
+        Args:
+            response: The response that triggered the retry
+            attempt: Number of retries already made
+            
+        Returns:
+            Delay in seconds
+        """
+        try:
+            delay = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            delay = _RETRY_BASE_DELAY * 2 ** attempt
+        delay = min(max(delay, 0.0), _RETRY_MAX_DELAY)
+        return delay + random.uniform(0, delay / 4)
     
-    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Make a GET request"""
-        return await self.make_request("GET", endpoint, params=params)
+    async def batch(self, requests: List[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Make several requests concurrently over the shared connection pool
+        
+        Args:
+            requests: (method, endpoint, kwargs) tuples, where kwargs are
+                passed to make_request (e.g. params or data)
+            
+        Returns:
+            API response data, in the same order as the requests
+        """
+        return await asyncio.gather(*(
+            self.make_request(method, endpoint, **kwargs)
+            for method, endpoint, kwargs in requests
+        ))
+    
+    async def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Mapping[str, Any]] = None,
+        ttl: float = 0,
+        max_pages: Optional[int] = None,
+        max_items: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every page of a paginated listing
+        
+        The next page is requested as soon as its token is known, so it is
+        in flight while the caller processes the current page. Once max_pages
+        pages or max_items items have been yielded, no further page is
+        requested, so the caller never pays for a page it will not read.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters for the first page
+            ttl: Seconds to cache each page for (0 disables caching)
+            max_pages: Maximum number of pages to yield (None for all)
+            max_items: Stop after the page that brings the items to this many
+            
+        Yields:
+            API response data for each page
+        """
+        params = dict(params or {})
+        page = await self.get(endpoint, params=params, ttl=ttl)
+        pages_seen = 0
+        items_seen = 0
+        next_request = None
+        try:
+            while True:
+                pages_seen += 1
+                items_seen += len(page.get(PAGE_ITEMS, ()))
+                page_token = page.get(NEXT_PAGE_TOKEN)
+                if max_pages is not None and pages_seen >= max_pages:
+                    page_token = None
+                if max_items is not None and items_seen >= max_items:
+                    page_token = None
+                if page_token:
+                    params["page_token"] = page_token
+                    next_request = asyncio.ensure_future(self.get(endpoint, params=dict(params), ttl=ttl))
+                
+                yield page
+                
+                if next_request is None:
+                    return
+                page = await next_request
+                next_request = None
+        finally:
+            # The caller stopped early; cancelling the prefetch also cancels
+            # its HTTP request unless another caller is awaiting the same page
+            if next_request is not None:
+                next_request.cancel()
+    
+    def _forget_inflight(self, key: Tuple, inflight: _InflightRequest):
+        """Stop sharing an in-flight request with new callers"""
+        if self._inflight.get(key) is inflight:
+            del self._inflight[key]
+    
+    def invalidate_cache(self, endpoint: str):
+        """Drop cached GET responses for an endpoint (for any params)"""
+        _response_cache.invalidate_matching(lambda key: key[1] == endpoint)
+    
+    def invalidate_cache_matching(self, predicate: Callable[[str], bool]):
+        """Drop cached GET responses for every endpoint matching predicate"""
+        _response_cache.invalidate_matching(lambda key: predicate(key[1]))
+    
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Mapping[str, Any]] = None,
+        ttl: float = 0
+    ) -> Dict[str, Any]:
+        """
+        Make a GET request, coalescing identical concurrent requests
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            ttl: Seconds to cache the response for (0 disables caching)
+            
+        Returns:
+            API response data
+        """
+        params_key = tuple(sorted(params.items())) if params else ()
+        key = self._token_key(endpoint, params_key)
+        if ttl:
+            cached = _response_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = _InflightRequest(
+                asyncio.ensure_future(self.make_request("GET", endpoint, params=params))
+            )
+            self._inflight[key] = inflight
+            inflight.future.add_done_callback(lambda _: self._forget_inflight(key, inflight))
+        
+        # Shield so one cancelled caller does not cancel the request for the
+        # others; once every caller is gone the request itself is cancelled
+        inflight.waiters += 1
+        try:
+            result = await asyncio.shield(inflight.future)
+        finally:
+            inflight.waiters -= 1
+            if not inflight.waiters and not inflight.future.done():
+                self._forget_inflight(key, inflight)
+                inflight.future.cancel()
+        if ttl:
+            _response_cache.set(key, result, ttl=ttl)
+        return result
     
     async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a POST request"""
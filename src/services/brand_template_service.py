@@ -3,11 +3,16 @@ Brand template service for Canva API
 Handles brand template operations
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Optional, AsyncIterator
 
-from .base_service import BaseService
-from ..models.canva_types import CanvaConfig, CanvaBrandTemplate
+from .base_service import BaseService, page_params, SHORT_CACHE_TTL
+from ..models.canva_types import CanvaBrandTemplate
+from ..utils.dates import parse_iso
+
+# Brand templates rarely change within a session; listings are kept shorter
+# so newly published templates show up quickly
+_DATASET_CACHE_TTL = 60
+_LIST_CACHE_TTL = 15
 
 class BrandTemplateService(BaseService):
     """Service for handling brand template operations"""
@@ -27,11 +32,27 @@ class BrandTemplateService(BaseService):
         Returns:
             List of brand templates
         """
-        params = {"limit": limit}
-        if page_token:
-            params["page_token"] = page_token
+        params = page_params(limit, page_token)
         
-        return await self.get("/brand-templates", params=params)
+        return await self.get("/brand-templates", params=params, ttl=_LIST_CACHE_TTL)
+    
+    async def iter_brand_templates(
+        self,
+        limit: int = 50,
+        max_items: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every page of brand templates for the user.
+        
+        Args:
+            limit: Maximum number of templates per page
+            max_items: Stop after the page that brings the templates to this many
+            
+        Yields:
+            Pages of brand templates
+        """
+        async for page in self.iter_pages("/brand-templates", params={"limit": limit}, max_items=max_items):
+            yield page
     
     async def get_brand_template(self, template_id: str) -> CanvaBrandTemplate:
         """
@@ -43,14 +64,14 @@ class BrandTemplateService(BaseService):
         Returns:
             Brand template metadata
         """
-        response = await self.get(f"/brand-templates/{template_id}")
+        response = await self.get(f"/brand-templates/{template_id}", ttl=SHORT_CACHE_TTL)
         
         return CanvaBrandTemplate(
             id=response["brand_template"]["id"],
             title=response["brand_template"]["title"],
             description=response["brand_template"].get("description"),
-            created_at=datetime.fromisoformat(response["brand_template"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["brand_template"]["updated_at"].replace("Z", "+00:00")),
+            created_at=parse_iso(response["brand_template"]["created_at"]),
+            updated_at=parse_iso(response["brand_template"]["updated_at"]),
             has_dataset=response["brand_template"].get("has_dataset", False)
         )
     
@@ -64,4 +85,4 @@ class BrandTemplateService(BaseService):
         Returns:
             Brand template dataset information
         """
-        return await self.get(f"/brand-templates/{template_id}/dataset") 
\ No newline at end of file
+        return await self.get(f"/brand-templates/{template_id}/dataset", ttl=_DATASET_CACHE_TTL) 
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+In-memory response cache for Canva API services
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+class TTLCache:
+    """Bounded LRU cache with optional per-entry expiry"""
+    
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[Optional[float], Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or default if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until expiry (defaults to the cache TTL, None for no expiry)
+        """
+        if ttl is None:
+            ttl = self.ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def invalidate(self, key: Hashable):
+        """Remove a key from the cache if present"""
+        self._data.pop(key, None)
+    
+    def invalidate_matching(self, predicate: Callable[[Hashable], bool]):
+        """Remove every key for which predicate(key) is true"""
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+    
+    def clear(self):
+        """Remove all entries"""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+class PendingJobCache:
+    """
+    Last fetched result of jobs that are still running, reused for an
+    interval that doubles (up to max_interval) each time a fetch finds
+    the status unchanged
+    """
+    
+    def __init__(self, maxsize: int = 1024, max_interval: float = 30.0):
+        self.max_interval = max_interval
+        # key -> (job, fetched_at, unchanged fetches); stale entries expire
+        self._entries = TTLCache(maxsize=maxsize, ttl=max_interval * 10)
+    
+    def _interval(self, unchanged: int) -> float:
+        return min(2.0 ** unchanged, self.max_interval)
+    
+    def get(self, key: Hashable) -> Any:
+        """Get the last result if it is still within its poll interval, else None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        job, fetched_at, unchanged = entry
+        if time.monotonic() - fetched_at < self._interval(unchanged):
+            return job
+        return None
+    
+    def record(self, key: Hashable, job: Any):
+        """Store a freshly fetched job, backing off further if its status did not change"""
+        entry = self._entries.get(key)
+        unchanged = entry[2] + 1 if entry is not None and entry[0].status == job.status else 0
+        self._entries.set(key, (job, time.monotonic(), unchanged))
+    
+    def poll_interval(self, key: Hashable) -> Optional[float]:
+        """Seconds a client should wait before polling the job again, None if unknown"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return self._interval(entry[2])
+    
+    def discard(self, key: Hashable):
+        """Forget a job, e.g. once it reaches a terminal status"""
+        self._entries.invalidate(key)
@@ -3,15 +3,33 @@ Comment service for Canva API
 Handles comment operations
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Optional, AsyncIterator
 
-from .base_service import BaseService
-from ..models.canva_types import CanvaConfig, CanvaComment
+from .base_service import BaseService, page_params, SHORT_CACHE_TTL
+from ..models.canva_types import CanvaComment
+from ..utils.dates import parse_iso
 
 class CommentService(BaseService):
     """Service for handling comment operations"""
     
+    @staticmethod
+    def _comment_from(
+        comment: Dict[str, Any],
+        design_id: str,
+        parent_id: Optional[str] = None
+    ) -> CanvaComment:
+        """Build a comment from the API comment payload"""
+        return CanvaComment(
+            id=comment["id"],
+            content=comment["content"],
+            created_at=parse_iso(comment["created_at"]),
+            updated_at=parse_iso(comment["updated_at"]),
+            author_id=comment["author_id"],
+            design_id=design_id,
+            page_id=comment.get("page_id"),
+            parent_id=parent_id if parent_id is not None else comment.get("parent_id")
+        )
+    
     async def create_comment_thread(
         self,
         design_id: str,
@@ -34,17 +52,7 @@ class CommentService(BaseService):
             data["page_id"] = page_id
         
         response = await self.post(f"/designs/{design_id}/comments", data=data)
-        
-        return CanvaComment(
-            id=response["comment"]["id"],
-            content=response["comment"]["content"],
-            created_at=datetime.fromisoformat(response["comment"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["comment"]["updated_at"].replace("Z", "+00:00")),
-            author_id=response["comment"]["author_id"],
-            design_id=design_id,
-            page_id=response["comment"].get("page_id"),
-            parent_id=response["comment"].get("parent_id")
-        )
+        return self._comment_from(response["comment"], design_id)
     
     async def create_comment_reply(
         self,
@@ -66,17 +74,8 @@ class CommentService(BaseService):
         data = {"content": content}
         
         response = await self.post(f"/designs/{design_id}/comments/{thread_id}/replies", data=data)
-        
-        return CanvaComment(
-            id=response["comment"]["id"],
-            content=response["comment"]["content"],
-            created_at=datetime.fromisoformat(response["comment"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["comment"]["updated_at"].replace("Z", "+00:00")),
-            author_id=response["comment"]["author_id"],
-            design_id=design_id,
-            page_id=response["comment"].get("page_id"),
-            parent_id=thread_id
-        )
+        self.invalidate_cache(f"/designs/{design_id}/comments/{thread_id}")
+        return self._comment_from(response["comment"], design_id, parent_id=thread_id)
     
     async def get_comment_thread(self, design_id: str, thread_id: str) -> CanvaComment:
         """
@@ -89,18 +88,8 @@ class CommentService(BaseService):
         Returns:
             Comment thread metadata
         """
-        response = await self.get(f"/designs/{design_id}/comments/{thread_id}")
-        
-        return CanvaComment(
-            id=response["comment"]["id"],
-            content=response["comment"]["content"],
-            created_at=datetime.fromisoformat(response["comment"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["comment"]["updated_at"].replace("Z", "+00:00")),
-            author_id=response["comment"]["author_id"],
-            design_id=design_id,
-            page_id=response["comment"].get("page_id"),
-            parent_id=response["comment"].get("parent_id")
-        )
+        response = await self.get(f"/designs/{design_id}/comments/{thread_id}", ttl=SHORT_CACHE_TTL)
+        return self._comment_from(response["comment"], design_id)
     
     async def list_comment_replies(
         self,
@@ -121,8 +110,29 @@ class CommentService(BaseService):
         Returns:
             List of comment replies
         """
-        params = {"limit": limit}
-        if page_token:
-            params["page_token"] = page_token
+        params = page_params(limit, page_token)
         
-        return await self.get(f"/designs/{design_id}/comments/{thread_id}/replies", params=params) 
\ No newline at end of file
+        return await self.get(f"/designs/{design_id}/comments/{thread_id}/replies", params=params)
+    
+    async def iter_comment_replies(
+        self,
+        design_id: str,
+        thread_id: str,
+        limit: int = 50,
+        max_items: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every page of replies to a comment on a design.
+        
+        Args:
+            design_id: The ID of the design
+            thread_id: The ID of the comment thread
+            limit: Maximum number of replies per page
+            max_items: Stop after the page that brings the replies to this many
+            
+        Yields:
+            Pages of comment replies
+        """
+        endpoint = f"/designs/{design_id}/comments/{thread_id}/replies"
+        async for page in self.iter_pages(endpoint, params={"limit": limit}, max_items=max_items):
+            yield page 
\ No newline at end of file
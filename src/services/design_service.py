@@ -3,15 +3,34 @@ Design service for Canva API
 Handles design creation, listing, and management
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import asyncio
+from typing import Dict, Any, Optional, AsyncIterator
 
-from .base_service import BaseService
-from ..models.canva_types import CanvaConfig, CanvaDesign
+from .base_service import BaseService, page_params, SHORT_CACHE_TTL
+from ..models.canva_types import CanvaDesign, CanvaDesignBundle
+from ..utils.dates import parse_iso
+
+# Export formats for a design rarely change within a session
+_EXPORT_FORMATS_CACHE_TTL = 300
+# Design listings, dropped early by create_design
+_LIST_CACHE_TTL = 15
 
 class DesignService(BaseService):
     """Service for handling design-related operations"""
     
+    @staticmethod
+    def _design_from(design: Dict[str, Any]) -> CanvaDesign:
+        """Build a design from the API design payload"""
+        return CanvaDesign(
+            id=design["id"],
+            title=design["title"],
+            created_at=parse_iso(design["created_at"]),
+            updated_at=parse_iso(design["updated_at"]),
+            thumbnail_url=design.get("thumbnail_url"),
+            folder_id=design.get("folder_id"),
+            brand_kit_id=design.get("brand_kit_id")
+        )
+    
     async def create_design(
         self,
         title: str,
@@ -36,16 +55,8 @@ class DesignService(BaseService):
             data["folder_id"] = folder_id
         
         response = await self.post("/designs", data=data)
-        
-        return CanvaDesign(
-            id=response["design"]["id"],
-            title=response["design"]["title"],
-            created_at=datetime.fromisoformat(response["design"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["design"]["updated_at"].replace("Z", "+00:00")),
-            thumbnail_url=response["design"].get("thumbnail_url"),
-            folder_id=response["design"].get("folder_id"),
-            brand_kit_id=response["design"].get("brand_kit_id")
-        )
+        self.invalidate_cache("/designs")
+        return self._design_from(response["design"])
     
     async def list_designs(
         self,
@@ -64,13 +75,35 @@ class DesignService(BaseService):
         Returns:
             List of designs
         """
+        params = page_params(limit, page_token)
+        if folder_id:
+            params = {**params, "folder_id": folder_id}
+        
+        return await self.get("/designs", params=params, ttl=_LIST_CACHE_TTL)
+    
+    async def iter_designs(
+        self,
+        limit: int = 50,
+        folder_id: Optional[str] = None,
+        max_items: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every page of designs for the current user.
+        
+        Args:
+            limit: Maximum number of designs per page
+            folder_id: Optional folder ID to filter designs
+            max_items: Stop after the page that brings the designs to this many
+            
+        Yields:
+            Pages of designs
+        """
         params = {"limit": limit}
-        if page_token:
-            params["page_token"] = page_token
         if folder_id:
             params["folder_id"] = folder_id
         
-        return await self.get("/designs", params=params)
+        async for page in self.iter_pages("/designs", params=params, max_items=max_items):
+            yield page
     
     async def get_design(self, design_id: str) -> CanvaDesign:
         """
@@ -82,17 +115,8 @@ class DesignService(BaseService):
         Returns:
             Design metadata
         """
-        response = await self.get(f"/designs/{design_id}")
-        
-        return CanvaDesign(
-            id=response["design"]["id"],
-            title=response["design"]["title"],
-            created_at=datetime.fromisoformat(response["design"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["design"]["updated_at"].replace("Z", "+00:00")),
-            thumbnail_url=response["design"].get("thumbnail_url"),
-            folder_id=response["design"].get("folder_id"),
-            brand_kit_id=response["design"].get("brand_kit_id")
-        )
+        response = await self.get(f"/designs/{design_id}", ttl=SHORT_CACHE_TTL)
+        return self._design_from(response["design"])
     
     async def get_design_pages(self, design_id: str) -> Dict[str, Any]:
         """
@@ -104,7 +128,7 @@ class DesignService(BaseService):
         Returns:
             Design pages information
         """
-        return await self.get(f"/designs/{design_id}/pages")
+        return await self.get(f"/designs/{design_id}/pages", ttl=SHORT_CACHE_TTL)
     
     async def get_design_export_formats(self, design_id: str) -> Dict[str, Any]:
         """
@@ -116,4 +140,23 @@ class DesignService(BaseService):
         Returns:
             Available export formats
         """
-        return await self.get(f"/designs/{design_id}/export/formats") 
\ No newline at end of file
+        return await self.get(f"/designs/{design_id}/export/formats", ttl=_EXPORT_FORMATS_CACHE_TTL)
+    
+    async def get_design_bundle(self, design_id: str) -> CanvaDesignBundle:
+        """
+        Get a design's metadata, pages and export formats in one call.
+        
+        The three requests are sent concurrently over the shared connection.
+        
+        Args:
+            design_id: The ID of the design
+            
+        Returns:
+            Design metadata with its pages and export formats
+        """
+        design, pages, export_formats = await asyncio.gather(
+            self.get_design(design_id),
+            self.get_design_pages(design_id),
+            self.get_design_export_formats(design_id)
+        )
+        return CanvaDesignBundle(design=design, pages=pages, export_formats=export_formats)
@@ -4,18 +4,31 @@ Handles design export operations
 """
 
 from typing import Dict, Any, Optional
-from datetime import datetime
 
 from .base_service import BaseService
-from ..models.canva_types import CanvaConfig, CanvaExportJob, CanvaFileType
+from ..models.canva_types import CanvaExportJob, CanvaFileTypeT
+from ..utils.dates import parse_iso, parse_iso_opt
 
 class ExportService(BaseService):
     """Service for handling export-related operations"""
     
+    @staticmethod
+    def _export_job_from(job: Dict[str, Any], file_type: Optional[CanvaFileTypeT] = None) -> CanvaExportJob:
+        """Build an export job from the API job payload"""
+        return CanvaExportJob(
+            id=job["id"],
+            status=job["status"],
+            file_type=file_type if file_type is not None else job["file_type"],
+            created_at=parse_iso(job["created_at"]),
+            completed_at=parse_iso_opt(job.get("completed_at")),
+            download_url=job.get("download_url"),
+            error_message=job.get("error_message")
+        )
+    
     async def create_design_export_job(
         self,
         design_id: str,
-        file_type: CanvaFileType,
+        file_type: CanvaFileTypeT,
         page_range: Optional[str] = None
     ) -> CanvaExportJob:
         """
@@ -30,22 +43,13 @@ class ExportService(BaseService):
             Export job information
         """
         data = {
-            "file_type": file_type.value
+            "file_type": file_type
         }
         if page_range:
             data["page_range"] = page_range
         
         response = await self.post(f"/designs/{design_id}/exports", data=data)
-        
-        return CanvaExportJob(
-            id=response["job"]["id"],
-            status=response["job"]["status"],
-            file_type=file_type,
-            created_at=datetime.fromisoformat(response["job"]["created_at"].replace("Z", "+00:00")),
-            completed_at=datetime.fromisoformat(response["job"]["completed_at"].replace("Z", "+00:00")) if response["job"].get("completed_at") else None,
-            download_url=response["job"].get("download_url"),
-            error_message=response["job"].get("error_message")
-        )
+        return self._export_job_from(response["job"], file_type=file_type)
     
     async def get_design_export_job(self, job_id: str) -> CanvaExportJob:
         """
@@ -58,13 +62,4 @@ class ExportService(BaseService):
             Export job status and results
         """
         response = await self.get(f"/exports/{job_id}")
-        
-        return CanvaExportJob(
-            id=response["job"]["id"],
-            status=response["job"]["status"],
-            file_type=CanvaFileType(response["job"]["file_type"]),
-            created_at=datetime.fromisoformat(response["job"]["created_at"].replace("Z", "+00:00")),
-            completed_at=datetime.fromisoformat(response["job"]["completed_at"].replace("Z", "+00:00")) if response["job"].get("completed_at") else None,
-            download_url=response["job"].get("download_url"),
-            error_message=response["job"].get("error_message")
-        ) 
\ No newline at end of file
+        return self._export_job_from(response["job"]) 
\ No newline at end of file
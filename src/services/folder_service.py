@@ -3,15 +3,37 @@ Folder service for Canva API
 Handles folder creation, management, and operations
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, AsyncIterator
 
-from .base_service import BaseService
-from ..models.canva_types import CanvaConfig, CanvaFolder
+from .base_service import BaseService, PAGE_ITEMS, page_params
+from ..models.canva_types import CanvaFolder
+from ..utils.dates import parse_iso
+
+# Folder metadata is read far more often than it changes; writes through
+# this service invalidate it, the TTL bounds changes made elsewhere
+_FOLDER_CACHE_TTL = 30
+# Listing pages, so paging back and forth within a session hits memory
+_LISTING_CACHE_TTL = 60
+
+def _is_folder_listing(endpoint: str) -> bool:
+    """Whether an endpoint lists the items of a folder"""
+    return endpoint.startswith("/folders/") and endpoint.endswith("/items")
 
 class FolderService(BaseService):
     """Service for handling folder-related operations"""
     
+    @staticmethod
+    def _folder_from(folder: Dict[str, Any]) -> CanvaFolder:
+        """Build a folder from the API folder payload"""
+        return CanvaFolder(
+            id=folder["id"],
+            name=folder["name"],
+            created_at=parse_iso(folder["created_at"]),
+            updated_at=parse_iso(folder["updated_at"]),
+            parent_folder_id=folder.get("parent_folder_id"),
+            item_count=folder.get("item_count")
+        )
+    
     async def create_folder(
         self,
         name: str,
@@ -32,15 +54,10 @@ class FolderService(BaseService):
             data["parent_folder_id"] = parent_folder_id
         
         response = await self.post("/folders", data=data)
-        
-        return CanvaFolder(
-            id=response["folder"]["id"],
-            name=response["folder"]["name"],
-            created_at=datetime.fromisoformat(response["folder"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["folder"]["updated_at"].replace("Z", "+00:00")),
-            parent_folder_id=response["folder"].get("parent_folder_id"),
-            item_count=response["folder"].get("item_count")
-        )
+        if parent_folder_id:
+            self.invalidate_cache(f"/folders/{parent_folder_id}")
+            self.invalidate_cache(f"/folders/{parent_folder_id}/items")
+        return self._folder_from(response["folder"])
     
     async def get_folder(self, folder_id: str) -> CanvaFolder:
         """
@@ -52,16 +69,8 @@ class FolderService(BaseService):
         Returns:
             Folder metadata
         """
-        response = await self.get(f"/folders/{folder_id}")
-        
-        return CanvaFolder(
-            id=response["folder"]["id"],
-            name=response["folder"]["name"],
-            created_at=datetime.fromisoformat(response["folder"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["folder"]["updated_at"].replace("Z", "+00:00")),
-            parent_folder_id=response["folder"].get("parent_folder_id"),
-            item_count=response["folder"].get("item_count")
-        )
+        response = await self.get(f"/folders/{folder_id}", ttl=_FOLDER_CACHE_TTL)
+        return self._folder_from(response["folder"])
     
     async def update_folder(
         self,
@@ -83,15 +92,8 @@ class FolderService(BaseService):
             data["name"] = name
         
         response = await self.patch(f"/folders/{folder_id}", data=data)
-        
-        return CanvaFolder(
-            id=response["folder"]["id"],
-            name=response["folder"]["name"],
-            created_at=datetime.fromisoformat(response["folder"]["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(response["folder"]["updated_at"].replace("Z", "+00:00")),
-            parent_folder_id=response["folder"].get("parent_folder_id"),
-            item_count=response["folder"].get("item_count")
-        )
+        self.invalidate_cache(f"/folders/{folder_id}")
+        return self._folder_from(response["folder"])
     
     async def delete_folder(self, folder_id: str) -> Dict[str, Any]:
         """
@@ -103,30 +105,75 @@ class FolderService(BaseService):
         Returns:
             Deletion confirmation
         """
+        self.invalidate_cache(f"/folders/{folder_id}")
+        # The parent folder is not known here, so drop every cached listing
+        self.invalidate_cache_matching(_is_folder_listing)
         return await self.delete(f"/folders/{folder_id}")
     
     async def list_folder_items(
         self,
         folder_id: str,
         limit: int = 50,
-        page_token: Optional[str] = None
+        page_token: Optional[str] = None,
+        prefetch_pages: int = 0
     ) -> Dict[str, Any]:
         """
         List the contents of a folder.
         
+        With prefetch_pages, up to that many following pages are fetched too
+        (each one requested while the previous is being merged) and their
+        items returned together with the continuation of the last page.
+        
         Args:
             folder_id: The ID of the folder
-            limit: Maximum number of items to return
+            limit: Maximum number of items to return per page
             page_token: Token for pagination
+            prefetch_pages: Number of following pages to include
             
         Returns:
             Folder contents
         """
-        params = {"limit": limit}
-        if page_token:
-            params["page_token"] = page_token
+        endpoint = f"/folders/{folder_id}/items"
+        params = page_params(limit, page_token)
+        if prefetch_pages <= 0:
+            return await self.get(endpoint, params=params, ttl=_LISTING_CACHE_TTL)
         
-        return await self.get(f"/folders/{folder_id}/items", params=params)
+        items: List[Any] = []
+        # max_pages keeps iter_pages from requesting a page past the last one merged
+        async for page in self.iter_pages(
+            endpoint,
+            params=params,
+            ttl=_LISTING_CACHE_TTL,
+            max_pages=prefetch_pages + 1
+        ):
+            items.extend(page.get(PAGE_ITEMS, []))
+        
+        return {**page, PAGE_ITEMS: items}
+    
+    async def iter_folder_items(
+        self,
+        folder_id: str,
+        limit: int = 50,
+        max_items: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every page of a folder's contents.
+        
+        Args:
+            folder_id: The ID of the folder
+            limit: Maximum number of items per page
+            max_items: Stop after the page that brings the items to this many
+            
+        Yields:
+            Pages of folder contents
+        """
+        async for page in self.iter_pages(
+            f"/folders/{folder_id}/items",
+            params={"limit": limit},
+            ttl=_LISTING_CACHE_TTL,
+            max_items=max_items
+        ):
+            yield page
     
     async def move_folder_item(
         self,
@@ -150,4 +197,10 @@ class FolderService(BaseService):
             "item_type": item_type
         }
         
-        return await self.post(f"/folders/items/{item_id}/move", data=data) 
\ No newline at end of file
+        response = await self.post(f"/folders/items/{item_id}/move", data=data)
+        # The source folder is not known here, so drop every cached listing
+        self.invalidate_cache_matching(_is_folder_listing)
+        self.invalidate_cache(f"/folders/{destination_folder_id}")
+        if item_type == "folder":
+            self.invalidate_cache(f"/folders/{item_id}")
+        return response 
\ No newline at end of file
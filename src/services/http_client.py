@@ -0,0 +1,55 @@
+"""
+Shared HTTP client for Canva API services
+All services use one connection pool so warm connections are reused
+across endpoints
+"""
+
+import importlib.util
+from typing import Optional
+
+import httpx
+
+CANVA_API_BASE = "https://api.canva.com/rest/v1"
+
+# HTTP/2 lets concurrent requests share one connection; httpx needs the
+# optional h2 package for it (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Seconds an idle pooled connection is kept open; well past httpx's 5s
+# default, so the connection opened by BaseService.warmup is still there
+# when the first tool call arrives
+KEEPALIVE_EXPIRY = 300.0
+
+# Times a failed connection attempt is retried before giving up
+CONNECT_RETRIES = 3
+
+_client: Optional[httpx.AsyncClient] = None
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use"""
+    global _client
+    if _client is None:
+        # Pool options go on the transport: httpx ignores the client's
+        # http2/limits arguments once a transport is given
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            ),
+            retries=CONNECT_RETRIES
+        )
+        _client = httpx.AsyncClient(
+            base_url=CANVA_API_BASE,
+            transport=transport,
+            timeout=30.0
+        )
+    return _client
+
+async def close_shared_client():
+    """Close the shared HTTP client and its pooled connections"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -4,10 +4,13 @@ Handles user information and capabilities
 """
 
 from typing import Dict, Any
-from datetime import datetime
 
 from .base_service import BaseService
-from ..models.canva_types import CanvaConfig, CanvaUser
+from ..models.canva_types import CanvaUser
+from ..utils.dates import parse_iso
+
+# User details rarely change within a session
+_USER_CACHE_TTL = 300
 
 class UserService(BaseService):
     """Service for handling user-related operations"""
@@ -19,14 +22,14 @@ class UserService(BaseService):
         Returns:
             User information
         """
-        response = await self.get("/users/me")
+        response = await self.get("/users/me", ttl=_USER_CACHE_TTL)
         
         return CanvaUser(
             id=response["id"],
             display_name=response["display_name"],
             email=response.get("email"),
             team_id=response.get("team_id"),
-            created_at=datetime.fromisoformat(response["created_at"].replace("Z", "+00:00"))
+            created_at=parse_iso(response["created_at"])
         )
     
     async def get_user_profile(self) -> Dict[str, Any]:
@@ -36,7 +39,7 @@ class UserService(BaseService):
         Returns:
             User profile information
         """
-        return await self.get("/users/profile")
+        return await self.get("/users/profile", ttl=_USER_CACHE_TTL)
     
     async def get_user_capabilities(self) -> Dict[str, Any]:
         """
@@ -45,4 +48,4 @@ class UserService(BaseService):
         Returns:
             User capabilities information
         """
-        return await self.get("/users/capabilities") 
\ No newline at end of file
+        return await self.get("/users/capabilities", ttl=_USER_CACHE_TTL) 
\ No newline at end of file
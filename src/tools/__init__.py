@@ -1,72 +1,94 @@
 """
 Tools module for Canva MCP Server
 Contains all MCP tools organized by category
+
+Tool submodules are imported on first attribute access, so importing a
+single module (e.g. ``src.tools.auth_tools``) does not load every service.
 """
 
-from .auth_tools import *
-from .user_tools import *
-from .design_tools import *
-from .asset_tools import *
-from .folder_tools import *
-from .export_tools import *
-from .brand_template_tools import *
-from .autofill_tools import *
-from .comment_tools import *
-from .utility_tools import *
+import importlib
 
-__all__ = [
+# Tool name -> submodule that defines it
+_TOOL_MODULES = {
     # Auth tools
-    'create_authorization_url',
-    'exchange_code_for_token',
-    'refresh_access_token',
-    'get_oauth_config',
-    'clear_tokens',
+    'create_authorization_url': 'auth_tools',
+    'exchange_code_for_token': 'auth_tools',
+    'refresh_access_token': 'auth_tools',
+    'get_oauth_config': 'auth_tools',
+    'clear_tokens': 'auth_tools',
     
     # User tools
-    'get_current_user',
-    'get_user_profile',
-    'get_user_capabilities',
+    'get_current_user': 'user_tools',
+    'get_user_profile': 'user_tools',
+    'get_user_capabilities': 'user_tools',
     
     # Design tools
-    'create_design',
-    'list_designs',
-    'get_design',
-    'get_design_pages',
-    'get_design_export_formats',
+    'create_design': 'design_tools',
+    'list_designs': 'design_tools',
+    'iter_designs': 'design_tools',
+    'get_design': 'design_tools',
+    'get_design_pages': 'design_tools',
+    'get_design_export_formats': 'design_tools',
+    'get_design_bundle': 'design_tools',
+    'get_designs_bulk': 'design_tools',
     
     # Asset tools
-    'create_asset_upload_job',
-    'get_asset_upload_job',
-    'create_url_asset_upload_job',
-    'get_url_asset_upload_job',
-    'get_asset',
-    'update_asset',
-    'delete_asset',
+    'create_asset_upload_job': 'asset_tools',
+    'get_asset_upload_job': 'asset_tools',
+    'create_url_asset_upload_job': 'asset_tools',
+    'get_url_asset_upload_job': 'asset_tools',
+    'get_asset': 'asset_tools',
+    'update_asset': 'asset_tools',
+    'delete_asset': 'asset_tools',
+    'get_assets_bulk': 'asset_tools',
     
     # Folder tools
-    'create_folder',
-    'get_folder',
-    'update_folder',
-    'delete_folder',
-    'list_folder_items',
-    'move_folder_item',
+    'create_folder': 'folder_tools',
+    'get_folder': 'folder_tools',
+    'update_folder': 'folder_tools',
+    'delete_folder': 'folder_tools',
+    'list_folder_items': 'folder_tools',
+    'iter_folder_items': 'folder_tools',
+    'move_folder_item': 'folder_tools',
     
     # Export tools
-    'create_design_export_job',
-    'get_design_export_job',
+    'create_design_export_job': 'export_tools',
+    'get_design_export_job': 'export_tools',
     
     # Brand template tools
-    'list_brand_templates',
-    'get_brand_template',
-    'get_brand_template_dataset',
+    'list_brand_templates': 'brand_template_tools',
+    'iter_brand_templates': 'brand_template_tools',
+    'get_brand_template': 'brand_template_tools',
+    'get_brand_template_dataset': 'brand_template_tools',
     
     # Autofill tools
-    'create_design_autofill_job',
-    'get_design_autofill_job',
+    'create_design_autofill_job': 'autofill_tools',
+    'get_design_autofill_job': 'autofill_tools',
     
     # Comment tools
-    'create_comment_thread',
-    'create_comment_reply',
-    'get_comment_thread',
-    'list_comment_replies',
-] 
\ No newline at end of file
+    'create_comment_thread': 'comment_tools',
+    'create_comment_reply': 'comment_tools',
+    'get_comment_thread': 'comment_tools',
+    'get_comment_threads_bulk': 'comment_tools',
+    'list_comment_replies': 'comment_tools',
+    'iter_comment_replies': 'comment_tools',
+}
+
+__all__ = list(_TOOL_MODULES)
+
+# Importable from src.tools like the tools above, but not in __all__, so
+# register_tools does not expose them to MCP clients
+_UTILITY_MODULES = {
+    'get_server_info': 'utility_tools',
+    'ping_server': 'utility_tools',
+}
+
+def __getattr__(name: str):
+    """Import the submodule defining a tool on first access"""
+    module_name = _TOOL_MODULES.get(name) or _UTILITY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    tool = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = tool
+    return tool
@@ -0,0 +1,37 @@
+"""
+Bounded concurrent fan-out for the bulk tools
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Iterable
+
+# API calls in flight across all bulk tools; keep it at or below the shared
+# client's max_connections so requests do not queue for a connection
+BULK_CONCURRENCY = max(1, int(os.environ.get("CANVA_BULK_CONCURRENCY", "16")))
+
+_semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+async def gather_bounded(
+    func: Callable[[Any], Awaitable[dict[str, Any]]],
+    items: Iterable[Any]
+) -> list[dict[str, Any]]:
+    """
+    Call func for every item concurrently, at most BULK_CONCURRENCY at a time.
+    
+    Args:
+        func: Coroutine function called with each item
+        items: Items to process
+        
+    Returns:
+        Results in the same order as the items; a failed item yields
+        {"error": message} instead of failing the whole batch
+    """
+    async def run_one(item: Any) -> dict[str, Any]:
+        async with _semaphore:
+            try:
+                return await func(item)
+            except Exception as e:
+                return {"error": str(e)}
+    
+    return await asyncio.gather(*(run_one(item) for item in items))
@@ -0,0 +1,38 @@
+"""
+Helpers for tools that walk every page of a listing
+"""
+
+from contextlib import aclosing
+from typing import Any, AsyncIterator
+
+from ..services.base_service import NEXT_PAGE_TOKEN, PAGE_ITEMS
+
+async def collect_items(pages: AsyncIterator[dict[str, Any]], max_items: int) -> dict[str, Any]:
+    """
+    Collect items from successive pages, stopping once max_items are gathered.
+    
+    Stopping early closes the page iterator. Iterators built with the same
+    max_items (see BaseService.iter_pages) do not prefetch past it at all.
+    
+    Args:
+        pages: Page iterator, e.g. from BaseService.iter_pages
+        max_items: Maximum number of items to collect (at least 1)
+        
+    Returns:
+        The items under "items", and "truncated" set when more were available
+    """
+    if max_items < 1:
+        raise ValueError(f"max_items must be at least 1, got {max_items}")
+    
+    items: list[Any] = []
+    truncated = False
+    async with aclosing(pages):
+        async for page in pages:
+            page_items = page.get(PAGE_ITEMS, [])
+            room = max_items - len(items)
+            items.extend(page_items[:room])
+            if len(items) >= max_items:
+                truncated = len(page_items) > room or bool(page.get(NEXT_PAGE_TOKEN))
+                break
+    
+    return {"items": items, "truncated": truncated}
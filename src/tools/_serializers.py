@@ -0,0 +1,142 @@
+"""
+Serializers turning Canva models into tool result dictionaries
+"""
+
+from typing import Any
+
+from ..models.canva_types import (
+    CanvaAsset,
+    CanvaAuthResponse,
+    CanvaAutofillJob,
+    CanvaBrandTemplate,
+    CanvaComment,
+    CanvaDesign,
+    CanvaExportJob,
+    CanvaFolder,
+    CanvaUploadJob,
+    CanvaUser
+)
+
+def serialize_upload_job(job: CanvaUploadJob) -> dict[str, Any]:
+    """Serialize an upload job"""
+    return {
+        "id": job.id,
+        "status": job.status,
+        "filename": job.filename,
+        "file_size": job.file_size,
+        "created_at": job.created_at.isoformat(),
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "asset_id": job.asset_id,
+        "error_message": job.error_message
+    }
+
+def serialize_autofill_job(job: CanvaAutofillJob) -> dict[str, Any]:
+    """Serialize an autofill job"""
+    return {
+        "id": job.id,
+        "status": job.status,
+        "brand_template_id": job.brand_template_id,
+        "created_at": job.created_at.isoformat(),
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "design_id": job.design_id,
+        "error_message": job.error_message
+    }
+
+def serialize_export_job(job: CanvaExportJob) -> dict[str, Any]:
+    """Serialize an export job"""
+    return {
+        "id": job.id,
+        "status": job.status,
+        "file_type": job.file_type,
+        "created_at": job.created_at.isoformat(),
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "download_url": job.download_url,
+        "error_message": job.error_message
+    }
+
+def serialize_asset(asset: CanvaAsset) -> dict[str, Any]:
+    """Serialize an asset"""
+    return {
+        "id": asset.id,
+        "title": asset.title,
+        "filename": asset.filename,
+        "file_size": asset.file_size,
+        "mime_type": asset.mime_type,
+        "created_at": asset.created_at.isoformat(),
+        "updated_at": asset.updated_at.isoformat(),
+        "folder_id": asset.folder_id,
+        "tags": asset.tags
+    }
+
+def serialize_design(design: CanvaDesign) -> dict[str, Any]:
+    """Serialize a design"""
+    return {
+        "id": design.id,
+        "title": design.title,
+        "created_at": design.created_at.isoformat(),
+        "updated_at": design.updated_at.isoformat(),
+        "thumbnail_url": design.thumbnail_url,
+        "folder_id": design.folder_id,
+        "brand_kit_id": design.brand_kit_id
+    }
+
+def serialize_folder(folder: CanvaFolder) -> dict[str, Any]:
+    """Serialize a folder"""
+    return {
+        "id": folder.id,
+        "name": folder.name,
+        "created_at": folder.created_at.isoformat(),
+        "updated_at": folder.updated_at.isoformat(),
+        "parent_folder_id": folder.parent_folder_id,
+        "item_count": folder.item_count
+    }
+
+def serialize_comment(comment: CanvaComment) -> dict[str, Any]:
+    """Serialize a comment"""
+    return {
+        "id": comment.id,
+        "content": comment.content,
+        "created_at": comment.created_at.isoformat(),
+        "updated_at": comment.updated_at.isoformat(),
+        "author_id": comment.author_id,
+        "design_id": comment.design_id,
+        "page_id": comment.page_id,
+        "parent_id": comment.parent_id
+    }
+
+def serialize_auth_response(response: CanvaAuthResponse) -> dict[str, Any]:
+    """Serialize an OAuth token response"""
+    return {
+        "access_token": response.access_token,
+        "token_type": response.token_type,
+        "expires_in": response.expires_in,
+        "scope": response.scope,
+        "refresh_token": response.refresh_token
+    }
+
+def serialize_brand_template(template: CanvaBrandTemplate) -> dict[str, Any]:
+    """Serialize a brand template"""
+    return {
+        "id": template.id,
+        "title": template.title,
+        "description": template.description,
+        "created_at": template.created_at.isoformat(),
+        "updated_at": template.updated_at.isoformat(),
+        "has_dataset": template.has_dataset
+    }
+
+def serialize_user(user: CanvaUser) -> dict[str, Any]:
+    """Serialize a user"""
+    return {
+        "id": user.id,
+        "display_name": user.display_name,
+        "email": user.email,
+        "team_id": user.team_id,
+        "created_at": user.created_at.isoformat()
+    }
+
+def with_poll_interval(data: dict[str, Any], interval: float | None) -> dict[str, Any]:
+    """Add a poll_interval_seconds hint to a serialized job that is still running"""
+    if interval is None:
+        return data
+    return {**data, "poll_interval_seconds": interval}
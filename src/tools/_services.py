@@ -0,0 +1,34 @@
+"""
+Per-configuration service instances for the tool modules
+"""
+
+from typing import TypeVar
+
+from ..config_registry import get_config
+from ..services.base_service import BaseService
+from ..services.cache import TTLCache
+
+ServiceT = TypeVar("ServiceT", bound=BaseService)
+
+# Services keyed on (service class, id of the config they were built for);
+# each context bound with set_config gets its own instances, caches and
+# tokens. The cached service keeps its config alive, so the id stays unique
+_services = TTLCache(maxsize=256)
+
+def service_for(service_cls: type[ServiceT]) -> ServiceT:
+    """
+    Get the service of a class for the configuration active in this context.
+    
+    Args:
+        service_cls: Service class to get an instance of
+        
+    Returns:
+        Service bound to the current configuration, created on first use
+    """
+    config = get_config()
+    key = (service_cls, id(config))
+    service = _services.get(key)
+    if service is None or service.config is not config:
+        service = service_cls(config)
+        _services.set(key, service)
+    return service
@@ -2,24 +2,24 @@
 Asset tools for Canva MCP Server
 """
 
-import time
-from typing import Dict, Any, Optional, List
-from mcp.server.fastmcp import FastMCP
+from typing import Any
 
 from ..services.asset_service import AssetService
-from ..utils.logging import log_tool_execution
+from ..utils.logging import instrumented_tool
+from ._bulk import gather_bounded
+from ._serializers import serialize_asset, serialize_upload_job, with_poll_interval
+from ._services import service_for
 
-# Import the global config from auth_tools
-from .auth_tools import canva_config
-
-asset_service = AssetService(canva_config)
+def _asset_service() -> AssetService:
+    """Get the asset service for the active configuration"""
+    return service_for(AssetService)
 
+@instrumented_tool()
 async def create_asset_upload_job(
-    mcp: FastMCP,
     filename: str,
     file_size: int,
-    folder_id: Optional[str] = None
-) -> Dict[str, Any]:
+    folder_id: str | None = None
+) -> dict[str, Any]:
     """
     Create an asynchronous job to upload an asset.
     
@@ -31,27 +31,11 @@ async def create_asset_upload_job(
     Returns:
         Upload job information
     """
-    start_time = time.time()
-    try:
-        result = await asset_service.create_asset_upload_job(filename, file_size, folder_id)
-        duration = time.time() - start_time
-        log_tool_execution("create_asset_upload_job", True, duration)
-        return {
-            "id": result.id,
-            "status": result.status.value,
-            "filename": result.filename,
-            "file_size": result.file_size,
-            "created_at": result.created_at.isoformat(),
-            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
-            "asset_id": result.asset_id,
-            "error_message": result.error_message
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("create_asset_upload_job", False, duration, str(e))
-        raise
+    result = await _asset_service().create_asset_upload_job(filename, file_size, folder_id)
+    return serialize_upload_job(result)
 
-async def get_asset_upload_job(mcp: FastMCP, job_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_asset_upload_job(job_id: str) -> dict[str, Any]:
     """
     Get the status and results of an upload asset job.
     
@@ -61,32 +45,15 @@ async def get_asset_upload_job(mcp: FastMCP, job_id: str) -> Dict[str, Any]:
     Returns:
         Upload job status and results
     """
-    start_time = time.time()
-    try:
-        result = await asset_service.get_asset_upload_job(job_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_asset_upload_job", True, duration)
-        return {
-            "id": result.id,
-            "status": result.status.value,
-            "filename": result.filename,
-            "file_size": result.file_size,
-            "created_at": result.created_at.isoformat(),
-            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
-            "asset_id": result.asset_id,
-            "error_message": result.error_message
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_asset_upload_job", False, duration, str(e))
-        raise
+    result = await _asset_service().get_asset_upload_job(job_id)
+    return with_poll_interval(serialize_upload_job(result), _asset_service().upload_job_poll_interval(job_id))
 
+@instrumented_tool()
 async def create_url_asset_upload_job(
-    mcp: FastMCP,
     url: str,
     filename: str,
-    folder_id: Optional[str] = None
-) -> Dict[str, Any]:
+    folder_id: str | None = None
+) -> dict[str, Any]:
     """
     Create an asynchronous job to upload an asset from a URL.
     
@@ -98,27 +65,11 @@ async def create_url_asset_upload_job(
     Returns:
         Upload job information
     """
-    start_time = time.time()
-    try:
-        result = await asset_service.create_url_asset_upload_job(url, filename, folder_id)
-        duration = time.time() - start_time
-        log_tool_execution("create_url_asset_upload_job", True, duration)
-        return {
-            "id": result.id,
-            "status": result.status.value,
-            "filename": result.filename,
-            "file_size": result.file_size,
-            "created_at": result.created_at.isoformat(),
-            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
-            "asset_id": result.asset_id,
-            "error_message": result.error_message
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("create_url_asset_upload_job", False, duration, str(e))
-        raise
+    result = await _asset_service().create_url_asset_upload_job(url, filename, folder_id)
+    return serialize_upload_job(result)
 
-async def get_url_asset_upload_job(mcp: FastMCP, job_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_url_asset_upload_job(job_id: str) -> dict[str, Any]:
     """
     Get the status and results of a URL asset upload job.
     
@@ -128,27 +79,11 @@ async def get_url_asset_upload_job(mcp: FastMCP, job_id: str) -> Dict[str, Any]:
     Returns:
         Upload job status and results
     """
-    start_time = time.time()
-    try:
-        result = await asset_service.get_url_asset_upload_job(job_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_url_asset_upload_job", True, duration)
-        return {
-            "id": result.id,
-            "status": result.status.value,
-            "filename": result.filename,
-            "file_size": result.file_size,
-            "created_at": result.created_at.isoformat(),
-            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
-            "asset_id": result.asset_id,
-            "error_message": result.error_message
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_url_asset_upload_job", False, duration, str(e))
-        raise
+    result = await _asset_service().get_url_asset_upload_job(job_id)
+    return with_poll_interval(serialize_upload_job(result), _asset_service().url_upload_job_poll_interval(job_id))
 
-async def get_asset(mcp: FastMCP, asset_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_asset(asset_id: str) -> dict[str, Any]:
     """
     Get the metadata for an asset.
     
@@ -158,33 +93,15 @@ async def get_asset(mcp: FastMCP, asset_id: str) -> Dict[str, Any]:
     Returns:
         Asset metadata
     """
-    start_time = time.time()
-    try:
-        result = await asset_service.get_asset(asset_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_asset", True, duration)
-        return {
-            "id": result.id,
-            "title": result.title,
-            "filename": result.filename,
-            "file_size": result.file_size,
-            "mime_type": result.mime_type,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "folder_id": result.folder_id,
-            "tags": result.tags
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_asset", False, duration, str(e))
-        raise
+    result = await _asset_service().get_asset(asset_id)
+    return serialize_asset(result)
 
+@instrumented_tool()
 async def update_asset(
-    mcp: FastMCP,
     asset_id: str,
-    title: Optional[str] = None,
-    tags: Optional[List[str]] = None
-) -> Dict[str, Any]:
+    title: str | None = None,
+    tags: list[str] | None = None
+) -> dict[str, Any]:
     """
     Update the metadata for an asset.
     
@@ -196,28 +113,11 @@ async def update_asset(
     Returns:
         Updated asset information
     """
-    start_time = time.time()
-    try:
-        result = await asset_service.update_asset(asset_id, title, tags)
-        duration = time.time() - start_time
-        log_tool_execution("update_asset", True, duration)
-        return {
-            "id": result.id,
-            "title": result.title,
-            "filename": result.filename,
-            "file_size": result.file_size,
-            "mime_type": result.mime_type,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "folder_id": result.folder_id,
-            "tags": result.tags
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("update_asset", False, duration, str(e))
-        raise
+    result = await _asset_service().update_asset(asset_id, title, tags)
+    return serialize_asset(result)
 
-async def delete_asset(mcp: FastMCP, asset_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def delete_asset(asset_id: str) -> dict[str, Any]:
     """
     Delete an asset.
     
@@ -227,13 +127,20 @@ async def delete_asset(mcp: FastMCP, asset_id: str) -> Dict[str, Any]:
     Returns:
         Deletion confirmation
     """
-    start_time = time.time()
-    try:
-        result = await asset_service.delete_asset(asset_id)
-        duration = time.time() - start_time
-        log_tool_execution("delete_asset", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("delete_asset", False, duration, str(e))
-        raise 
\ No newline at end of file
+    return await _asset_service().delete_asset(asset_id)
+
+@instrumented_tool()
+async def get_assets_bulk(asset_ids: list[str]) -> list[dict[str, Any]]:
+    """
+    Get the metadata for several assets at once.
+    
+    Args:
+        asset_ids: The IDs of the assets
+        
+    Returns:
+        Asset metadata for each ID, in order; failed lookups hold an "error" message
+    """
+    async def get_one(asset_id: str) -> dict[str, Any]:
+        return serialize_asset(await _asset_service().get_asset(asset_id))
+    
+    return await gather_bounded(get_one, asset_ids)
@@ -3,23 +3,24 @@ Authentication tools for Canva MCP Server
 """
 
 import time
-from typing import Dict, Any
-from mcp.server.fastmcp import FastMCP
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from ..services.auth_service import AuthService
-from ..types.canva_types import CanvaConfig
-from ..utils.logging import log_tool_execution, logger
+from ..config_registry import get_config
+from ..utils.logging import instrumented_tool
+from ._serializers import serialize_auth_response
+from ._services import service_for
 
-# Global configuration (in production, this should be stored securely)
-canva_config = CanvaConfig(
-    client_id="",  # Will be loaded from environment
-    client_secret="",  # Will be loaded from environment
-    redirect_uri=""  # Will be loaded from environment
-)
+def _auth_service() -> AuthService:
+    """Get the auth service for the active configuration"""
+    return service_for(AuthService)
 
-auth_service = AuthService(canva_config)
+# Last get_oauth_config result, keyed on the config fields it is built from
+_oauth_config_cache: tuple[tuple, dict[str, Any]] | None = None
 
-def create_authorization_url(mcp: FastMCP, scopes: str = None) -> Dict[str, str]:
+@instrumented_tool()
+def create_authorization_url(scopes: str | None = None) -> dict[str, str]:
     """
     Create an OAuth authorization URL for Canva API access.
     
@@ -29,18 +30,10 @@ def create_authorization_url(mcp: FastMCP, scopes: str = None) -> Dict[str, str]
     Returns:
         Dictionary containing authorization URL and code verifier
     """
-    start_time = time.time()
-    try:
-        result = auth_service.create_authorization_url(scopes)
-        duration = time.time() - start_time
-        log_tool_execution("create_authorization_url", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("create_authorization_url", False, duration, str(e))
-        raise
+    return _auth_service().create_authorization_url(scopes)
 
-async def exchange_code_for_token(mcp: FastMCP, authorization_code: str, code_verifier: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def exchange_code_for_token(authorization_code: str, code_verifier: str) -> dict[str, Any]:
     """
     Exchange authorization code for access token.
     
@@ -51,85 +44,64 @@ async def exchange_code_for_token(mcp: FastMCP, authorization_code: str, code_ve
     Returns:
         Token response with access_token, refresh_token, and expiry
     """
-    start_time = time.time()
-    try:
-        result = await auth_service.exchange_code_for_token(authorization_code, code_verifier)
-        duration = time.time() - start_time
-        log_tool_execution("exchange_code_for_token", True, duration)
-        return {
-            "access_token": result.access_token,
-            "token_type": result.token_type,
-            "expires_in": result.expires_in,
-            "scope": result.scope,
-            "refresh_token": result.refresh_token
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("exchange_code_for_token", False, duration, str(e))
-        raise
+    result = await _auth_service().exchange_code_for_token(authorization_code, code_verifier)
+    return serialize_auth_response(result)
 
-async def refresh_access_token(mcp: FastMCP) -> Dict[str, Any]:
+@instrumented_tool()
+async def refresh_access_token() -> dict[str, Any]:
     """
     Refresh the access token using the refresh token.
     
+    The current token is returned as-is while it is valid for more than a minute.
+    
     Returns:
         New token response
     """
-    start_time = time.time()
-    try:
-        result = await auth_service.refresh_access_token()
-        duration = time.time() - start_time
-        log_tool_execution("refresh_access_token", True, duration)
-        return {
-            "access_token": result.access_token,
-            "token_type": result.token_type,
-            "expires_in": result.expires_in,
-            "scope": result.scope,
-            "refresh_token": result.refresh_token
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("refresh_access_token", False, duration, str(e))
-        raise
+    result = await _auth_service().refresh_access_token()
+    return serialize_auth_response(result)
 
-def get_oauth_config(mcp: FastMCP) -> Dict[str, str]:
+@instrumented_tool()
+def get_oauth_config() -> dict[str, Any]:
     """
     Get the current OAuth configuration.
     
     Returns:
         Current OAuth configuration
     """
-    start_time = time.time()
-    try:
+    global _oauth_config_cache
+    canva_config = get_config()
+    key = (
+        canva_config.client_id,
+        canva_config.redirect_uri,
+        canva_config.access_token,
+        canva_config.refresh_token,
+        canva_config.token_expires_at
+    )
+    if _oauth_config_cache is not None and _oauth_config_cache[0] == key:
+        result = _oauth_config_cache[1]
+    else:
+        token_expires_at = None
+        if canva_config.token_expires_at is not None:
+            remaining = canva_config.token_expires_at - time.monotonic()
+            token_expires_at = (datetime.now(timezone.utc) + timedelta(seconds=remaining)).isoformat()
+        
         result = {
             "client_id": canva_config.client_id,
             "redirect_uri": canva_config.redirect_uri,
             "has_access_token": bool(canva_config.access_token),
             "has_refresh_token": bool(canva_config.refresh_token),
-            "token_expires_at": canva_config.token_expires_at.isoformat() if canva_config.token_expires_at else None
+            "token_expires_at": token_expires_at
         }
-        duration = time.time() - start_time
-        log_tool_execution("get_oauth_config", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_oauth_config", False, duration, str(e))
-        raise
+        _oauth_config_cache = (key, result)
+    return result
 
-def clear_tokens(mcp: FastMCP) -> Dict[str, str]:
+@instrumented_tool()
+def clear_tokens() -> dict[str, str]:
     """
     Clear stored access and refresh tokens.
     
     Returns:
         Confirmation message
     """
-    start_time = time.time()
-    try:
-        auth_service.clear_tokens()
-        duration = time.time() - start_time
-        log_tool_execution("clear_tokens", True, duration)
-        return {"message": "Tokens cleared successfully"}
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("clear_tokens", False, duration, str(e))
-        raise 
\ No newline at end of file
+    _auth_service().clear_tokens()
+    return {"message": "Tokens cleared successfully"}
\ No newline at end of file
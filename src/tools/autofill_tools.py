@@ -2,23 +2,22 @@
 Autofill tools for Canva MCP Server
 """
 
-import time
-from typing import Dict, Any
-from mcp.server.fastmcp import FastMCP
+from typing import Any
 
 from ..services.autofill_service import AutofillService
-from ..utils.logging import log_tool_execution
+from ..utils.logging import instrumented_tool
+from ._serializers import serialize_autofill_job, with_poll_interval
+from ._services import service_for
 
-# Import the global config from auth_tools
-from .auth_tools import canva_config
-
-autofill_service = AutofillService(canva_config)
+def _autofill_service() -> AutofillService:
+    """Get the autofill service for the active configuration"""
+    return service_for(AutofillService)
 
+@instrumented_tool()
 async def create_design_autofill_job(
-    mcp: FastMCP,
     brand_template_id: str,
-    dataset: Dict[str, Any]
-) -> Dict[str, Any]:
+    dataset: dict[str, Any]
+) -> dict[str, Any]:
     """
     Create an asynchronous job to autofill a design from a brand template.
     
@@ -29,26 +28,11 @@ async def create_design_autofill_job(
     Returns:
         Autofill job information
     """
-    start_time = time.time()
-    try:
-        result = await autofill_service.create_design_autofill_job(brand_template_id, dataset)
-        duration = time.time() - start_time
-        log_tool_execution("create_design_autofill_job", True, duration)
-        return {
-            "id": result.id,
-            "status": result.status.value,
-            "brand_template_id": result.brand_template_id,
-            "created_at": result.created_at.isoformat(),
-            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
-            "design_id": result.design_id,
-            "error_message": result.error_message
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("create_design_autofill_job", False, duration, str(e))
-        raise
+    result = await _autofill_service().create_design_autofill_job(brand_template_id, dataset)
+    return serialize_autofill_job(result)
 
-async def get_design_autofill_job(mcp: FastMCP, job_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_design_autofill_job(job_id: str) -> dict[str, Any]:
     """
     Get the status and results of an autofill job.
     
@@ -58,21 +42,5 @@ async def get_design_autofill_job(mcp: FastMCP, job_id: str) -> Dict[str, Any]:
     Returns:
         Autofill job status and results
     """
-    start_time = time.time()
-    try:
-        result = await autofill_service.get_design_autofill_job(job_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_design_autofill_job", True, duration)
-        return {
-            "id": result.id,
-            "status": result.status.value,
-            "brand_template_id": result.brand_template_id,
-            "created_at": result.created_at.isoformat(),
-            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
-            "design_id": result.design_id,
-            "error_message": result.error_message
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_design_autofill_job", False, duration, str(e))
-        raise 
\ No newline at end of file
+    result = await _autofill_service().get_design_autofill_job(job_id)
+    return with_poll_interval(serialize_autofill_job(result), _autofill_service().autofill_job_poll_interval(job_id))
\ No newline at end of file
@@ -2,23 +2,23 @@
 Brand template tools for Canva MCP Server
 """
 
-import time
-from typing import Dict, Any, Optional
-from mcp.server.fastmcp import FastMCP
+from typing import Any
 
 from ..services.brand_template_service import BrandTemplateService
-from ..utils.logging import log_tool_execution
+from ..utils.logging import instrumented_tool
+from ._pagination import collect_items
+from ._serializers import serialize_brand_template
+from ._services import service_for
 
-# Import the global config from auth_tools
-from .auth_tools import canva_config
-
-brand_template_service = BrandTemplateService(canva_config)
+def _brand_template_service() -> BrandTemplateService:
+    """Get the brand template service for the active configuration"""
+    return service_for(BrandTemplateService)
 
+@instrumented_tool()
 async def list_brand_templates(
-    mcp: FastMCP,
     limit: int = 50,
-    page_token: Optional[str] = None
-) -> Dict[str, Any]:
+    page_token: str | None = None
+) -> dict[str, Any]:
     """
     List all brand templates for the user.
     
@@ -29,18 +29,26 @@ async def list_brand_templates(
     Returns:
         List of brand templates
     """
-    start_time = time.time()
-    try:
-        result = await brand_template_service.list_brand_templates(limit, page_token)
-        duration = time.time() - start_time
-        log_tool_execution("list_brand_templates", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("list_brand_templates", False, duration, str(e))
-        raise
+    return await _brand_template_service().list_brand_templates(limit, page_token)
+
+@instrumented_tool()
+async def iter_brand_templates(max_items: int = 200) -> dict[str, Any]:
+    """
+    List brand templates across pages, following pagination automatically.
+    
+    The next page is fetched while the current one is processed, and paging
+    stops as soon as max_items templates have been collected.
+    
+    Args:
+        max_items: Maximum number of templates to return
+        
+    Returns:
+        Brand templates under "items", with "truncated" set when more were available
+    """
+    return await collect_items(_brand_template_service().iter_brand_templates(max_items=max_items), max_items)
 
-async def get_brand_template(mcp: FastMCP, template_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_brand_template(template_id: str) -> dict[str, Any]:
     """
     Get metadata for a brand template.
     
@@ -50,25 +58,11 @@ async def get_brand_template(mcp: FastMCP, template_id: str) -> Dict[str, Any]:
     Returns:
         Brand template metadata
     """
-    start_time = time.time()
-    try:
-        result = await brand_template_service.get_brand_template(template_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_brand_template", True, duration)
-        return {
-            "id": result.id,
-            "title": result.title,
-            "description": result.description,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "has_dataset": result.has_dataset
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_brand_template", False, duration, str(e))
-        raise
+    result = await _brand_template_service().get_brand_template(template_id)
+    return serialize_brand_template(result)
 
-async def get_brand_template_dataset(mcp: FastMCP, template_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_brand_template_dataset(template_id: str) -> dict[str, Any]:
     """
     Get the dataset for a brand template to check autofill capabilities.
     
@@ -78,13 +72,4 @@ async def get_brand_template_dataset(mcp: FastMCP, template_id: str) -> Dict[str
     Returns:
         Brand template dataset information
     """
-    start_time = time.time()
-    try:
-        result = await brand_template_service.get_brand_template_dataset(template_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_brand_template_dataset", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_brand_template_dataset", False, duration, str(e))
-        raise 
\ No newline at end of file
+    return await _brand_template_service().get_brand_template_dataset(template_id)
\ No newline at end of file
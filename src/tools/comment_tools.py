@@ -2,24 +2,25 @@
 Comment tools for Canva MCP Server
 """
 
-import time
-from typing import Dict, Any, Optional
-from mcp.server.fastmcp import FastMCP
+from typing import Any
 
 from ..services.comment_service import CommentService
-from ..utils.logging import log_tool_execution
+from ..utils.logging import instrumented_tool
+from ._bulk import gather_bounded
+from ._pagination import collect_items
+from ._serializers import serialize_comment
+from ._services import service_for
 
-# Import the global config from auth_tools
-from .auth_tools import canva_config
-
-comment_service = CommentService(canva_config)
+def _comment_service() -> CommentService:
+    """Get the comment service for the active configuration"""
+    return service_for(CommentService)
 
+@instrumented_tool()
 async def create_comment_thread(
-    mcp: FastMCP,
     design_id: str,
     content: str,
-    page_id: Optional[str] = None
-) -> Dict[str, Any]:
+    page_id: str | None = None
+) -> dict[str, Any]:
     """
     Create a new comment thread on a design.
     
@@ -31,32 +32,15 @@ async def create_comment_thread(
     Returns:
         Created comment thread information
     """
-    start_time = time.time()
-    try:
-        result = await comment_service.create_comment_thread(design_id, content, page_id)
-        duration = time.time() - start_time
-        log_tool_execution("create_comment_thread", True, duration)
-        return {
-            "id": result.id,
-            "content": result.content,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "author_id": result.author_id,
-            "design_id": result.design_id,
-            "page_id": result.page_id,
-            "parent_id": result.parent_id
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("create_comment_thread", False, duration, str(e))
-        raise
+    result = await _comment_service().create_comment_thread(design_id, content, page_id)
+    return serialize_comment(result)
 
+@instrumented_tool()
 async def create_comment_reply(
-    mcp: FastMCP,
     design_id: str,
     thread_id: str,
     content: str
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """
     Reply to a comment on a design.
     
@@ -68,27 +52,11 @@ async def create_comment_reply(
     Returns:
         Created reply information
     """
-    start_time = time.time()
-    try:
-        result = await comment_service.create_comment_reply(design_id, thread_id, content)
-        duration = time.time() - start_time
-        log_tool_execution("create_comment_reply", True, duration)
-        return {
-            "id": result.id,
-            "content": result.content,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "author_id": result.author_id,
-            "design_id": result.design_id,
-            "page_id": result.page_id,
-            "parent_id": result.parent_id
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("create_comment_reply", False, duration, str(e))
-        raise
+    result = await _comment_service().create_comment_reply(design_id, thread_id, content)
+    return serialize_comment(result)
 
-async def get_comment_thread(mcp: FastMCP, design_id: str, thread_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_comment_thread(design_id: str, thread_id: str) -> dict[str, Any]:
     """
     Get metadata for a comment thread.
     
@@ -99,33 +67,36 @@ async def get_comment_thread(mcp: FastMCP, design_id: str, thread_id: str) -> Di
     Returns:
         Comment thread metadata
     """
-    start_time = time.time()
-    try:
-        result = await comment_service.get_comment_thread(design_id, thread_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_comment_thread", True, duration)
-        return {
-            "id": result.id,
-            "content": result.content,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "author_id": result.author_id,
-            "design_id": result.design_id,
-            "page_id": result.page_id,
-            "parent_id": result.parent_id
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_comment_thread", False, duration, str(e))
-        raise
+    result = await _comment_service().get_comment_thread(design_id, thread_id)
+    return serialize_comment(result)
+
+@instrumented_tool()
+async def get_comment_threads_bulk(
+    design_id: str,
+    thread_ids: list[str]
+) -> list[dict[str, Any]]:
+    """
+    Get metadata for several comment threads on a design at once.
+    
+    Args:
+        design_id: The ID of the design
+        thread_ids: The IDs of the comment threads
+        
+    Returns:
+        Comment thread metadata for each ID, in order; failed lookups hold an "error" message
+    """
+    async def get_one(thread_id: str) -> dict[str, Any]:
+        return serialize_comment(await _comment_service().get_comment_thread(design_id, thread_id))
+    
+    return await gather_bounded(get_one, thread_ids)
 
+@instrumented_tool()
 async def list_comment_replies(
-    mcp: FastMCP,
     design_id: str,
     thread_id: str,
     limit: int = 50,
-    page_token: Optional[str] = None
-) -> Dict[str, Any]:
+    page_token: str | None = None
+) -> dict[str, Any]:
     """
     List the replies to a comment on a design.
     
@@ -138,13 +109,27 @@ async def list_comment_replies(
     Returns:
         List of comment replies
     """
-    start_time = time.time()
-    try:
-        result = await comment_service.list_comment_replies(design_id, thread_id, limit, page_token)
-        duration = time.time() - start_time
-        log_tool_execution("list_comment_replies", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("list_comment_replies", False, duration, str(e))
-        raise 
\ No newline at end of file
+    return await _comment_service().list_comment_replies(design_id, thread_id, limit, page_token)
+
+@instrumented_tool()
+async def iter_comment_replies(
+    design_id: str,
+    thread_id: str,
+    max_items: int = 200
+) -> dict[str, Any]:
+    """
+    List the replies to a comment across pages, following pagination automatically.
+    
+    The next page is fetched while the current one is processed, and paging
+    stops as soon as max_items replies have been collected.
+    
+    Args:
+        design_id: The ID of the design
+        thread_id: The ID of the comment thread
+        max_items: Maximum number of replies to return
+        
+    Returns:
+        Comment replies under "items", with "truncated" set when more were available
+    """
+    replies = _comment_service().iter_comment_replies(design_id, thread_id, max_items=max_items)
+    return await collect_items(replies, max_items)
\ No newline at end of file
@@ -2,24 +2,25 @@
 Design tools for Canva MCP Server
 """
 
-import time
-from typing import Dict, Any, Optional
-from mcp.server.fastmcp import FastMCP
+from typing import Any
 
 from ..services.design_service import DesignService
-from ..utils.logging import log_tool_execution
+from ..utils.logging import instrumented_tool
+from ._bulk import gather_bounded
+from ._pagination import collect_items
+from ._serializers import serialize_design
+from ._services import service_for
 
-# Import the global config from auth_tools
-from .auth_tools import canva_config
-
-design_service = DesignService(canva_config)
+def _design_service() -> DesignService:
+    """Get the design service for the active configuration"""
+    return service_for(DesignService)
 
+@instrumented_tool()
 async def create_design(
-    mcp: FastMCP,
     title: str,
-    brand_kit_id: Optional[str] = None,
-    folder_id: Optional[str] = None
-) -> Dict[str, Any]:
+    brand_kit_id: str | None = None,
+    folder_id: str | None = None
+) -> dict[str, Any]:
     """
     Create a new Canva design.
     
@@ -31,31 +32,15 @@ async def create_design(
     Returns:
         Created design information
     """
-    start_time = time.time()
-    try:
-        result = await design_service.create_design(title, brand_kit_id, folder_id)
-        duration = time.time() - start_time
-        log_tool_execution("create_design", True, duration)
-        return {
-            "id": result.id,
-            "title": result.title,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "thumbnail_url": result.thumbnail_url,
-            "folder_id": result.folder_id,
-            "brand_kit_id": result.brand_kit_id
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("create_design", False, duration, str(e))
-        raise
+    result = await _design_service().create_design(title, brand_kit_id, folder_id)
+    return serialize_design(result)
 
+@instrumented_tool()
 async def list_designs(
-    mcp: FastMCP,
     limit: int = 50,
-    page_token: Optional[str] = None,
-    folder_id: Optional[str] = None
-) -> Dict[str, Any]:
+    page_token: str | None = None,
+    folder_id: str | None = None
+) -> dict[str, Any]:
     """
     List all designs for the current user.
     
@@ -67,18 +52,30 @@ async def list_designs(
     Returns:
         List of designs
     """
-    start_time = time.time()
-    try:
-        result = await design_service.list_designs(limit, page_token, folder_id)
-        duration = time.time() - start_time
-        log_tool_execution("list_designs", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("list_designs", False, duration, str(e))
-        raise
+    return await _design_service().list_designs(limit, page_token, folder_id)
 
-async def get_design(mcp: FastMCP, design_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def iter_designs(
+    folder_id: str | None = None,
+    max_items: int = 200
+) -> dict[str, Any]:
+    """
+    List designs across pages, following pagination automatically.
+    
+    The next page is fetched while the current one is processed, and paging
+    stops as soon as max_items designs have been collected.
+    
+    Args:
+        folder_id: Optional folder ID to filter designs
+        max_items: Maximum number of designs to return
+        
+    Returns:
+        Designs under "items", with "truncated" set when more were available
+    """
+    return await collect_items(_design_service().iter_designs(folder_id=folder_id, max_items=max_items), max_items)
+
+@instrumented_tool()
+async def get_design(design_id: str) -> dict[str, Any]:
     """
     Get metadata for a specific design.
     
@@ -88,26 +85,11 @@ async def get_design(mcp: FastMCP, design_id: str) -> Dict[str, Any]:
     Returns:
         Design metadata
     """
-    start_time = time.time()
-    try:
-        result = await design_service.get_design(design_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_design", True, duration)
-        return {
-            "id": result.id,
-            "title": result.title,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "thumbnail_url": result.thumbnail_url,
-            "folder_id": result.folder_id,
-            "brand_kit_id": result.brand_kit_id
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_design", False, duration, str(e))
-        raise
+    result = await _design_service().get_design(design_id)
+    return serialize_design(result)
 
-async def get_design_pages(mcp: FastMCP, design_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_design_pages(design_id: str) -> dict[str, Any]:
     """
     Get metadata for pages in a design.
     
@@ -117,18 +99,10 @@ async def get_design_pages(mcp: FastMCP, design_id: str) -> Dict[str, Any]:
     Returns:
         Design pages information
     """
-    start_time = time.time()
-    try:
-        result = await design_service.get_design_pages(design_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_design_pages", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_design_pages", False, duration, str(e))
-        raise
+    return await _design_service().get_design_pages(design_id)
 
-async def get_design_export_formats(mcp: FastMCP, design_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_design_export_formats(design_id: str) -> dict[str, Any]:
     """
     Get the export formats available for a design.
     
@@ -138,13 +112,38 @@ async def get_design_export_formats(mcp: FastMCP, design_id: str) -> Dict[str, A
     Returns:
         Available export formats
     """
-    start_time = time.time()
-    try:
-        result = await design_service.get_design_export_formats(design_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_design_export_formats", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_design_export_formats", False, duration, str(e))
-        raise 
\ No newline at end of file
+    return await _design_service().get_design_export_formats(design_id)
+
+@instrumented_tool()
+async def get_design_bundle(design_id: str) -> dict[str, Any]:
+    """
+    Get a design's metadata, pages and export formats in one call.
+    
+    Args:
+        design_id: The ID of the design
+        
+    Returns:
+        Design metadata with its pages and export formats
+    """
+    result = await _design_service().get_design_bundle(design_id)
+    return {
+        "design": serialize_design(result.design),
+        "pages": result.pages,
+        "export_formats": result.export_formats
+    }
+
+@instrumented_tool()
+async def get_designs_bulk(design_ids: list[str]) -> list[dict[str, Any]]:
+    """
+    Get metadata for several designs at once.
+    
+    Args:
+        design_ids: The IDs of the designs
+        
+    Returns:
+        Design metadata for each ID, in order; failed lookups hold an "error" message
+    """
+    async def get_one(design_id: str) -> dict[str, Any]:
+        return serialize_design(await _design_service().get_design(design_id))
+    
+    return await gather_bounded(get_one, design_ids)
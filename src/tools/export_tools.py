@@ -2,25 +2,26 @@
 Export tools for Canva MCP Server
 """
 
-import time
-from typing import Dict, Any, Optional
-from mcp.server.fastmcp import FastMCP
+from typing import Any, get_args
 
 from ..services.export_service import ExportService
-from ..models.canva_types import CanvaFileType
-from ..utils.logging import log_tool_execution
+from ..models.canva_types import CanvaFileTypeT
+from ..utils.logging import instrumented_tool
+from ._serializers import serialize_export_job
+from ._services import service_for
 
-# Import the global config from auth_tools
-from .auth_tools import canva_config
+def _export_service() -> ExportService:
+    """Get the export service for the active configuration"""
+    return service_for(ExportService)
 
-export_service = ExportService(canva_config)
+_VALID_FILE_TYPES = frozenset(get_args(CanvaFileTypeT))
 
+@instrumented_tool()
 async def create_design_export_job(
-    mcp: FastMCP,
     design_id: str,
     file_type: str,
-    page_range: Optional[str] = None
-) -> Dict[str, Any]:
+    page_range: str | None = None
+) -> dict[str, Any]:
     """
     Create an asynchronous job to export a design.
     
@@ -32,27 +33,13 @@ async def create_design_export_job(
     Returns:
         Export job information
     """
-    start_time = time.time()
-    try:
-        canva_file_type = CanvaFileType(file_type)
-        result = await export_service.create_design_export_job(design_id, canva_file_type, page_range)
-        duration = time.time() - start_time
-        log_tool_execution("create_design_export_job", True, duration)
-        return {
-            "id": result.id,
-            "status": result.status.value,
-            "file_type": result.file_type.value,
-            "created_at": result.created_at.isoformat(),
-            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
-            "download_url": result.download_url,
-            "error_message": result.error_message
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("create_design_export_job", False, duration, str(e))
-        raise
+    if file_type not in _VALID_FILE_TYPES:
+        raise ValueError(f"Invalid file_type: {file_type}")
+    result = await _export_service().create_design_export_job(design_id, file_type, page_range)
+    return serialize_export_job(result)
 
-async def get_design_export_job(mcp: FastMCP, job_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_design_export_job(job_id: str) -> dict[str, Any]:
     """
     Get the status and results of an export job.
     
@@ -62,21 +49,5 @@ async def get_design_export_job(mcp: FastMCP, job_id: str) -> Dict[str, Any]:
     Returns:
         Export job status and results
     """
-    start_time = time.time()
-    try:
-        result = await export_service.get_design_export_job(job_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_design_export_job", True, duration)
-        return {
-            "id": result.id,
-            "status": result.status.value,
-            "file_type": result.file_type.value,
-            "created_at": result.created_at.isoformat(),
-            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
-            "download_url": result.download_url,
-            "error_message": result.error_message
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_design_export_job", False, duration, str(e))
-        raise 
\ No newline at end of file
+    result = await _export_service().get_design_export_job(job_id)
+    return serialize_export_job(result)
\ No newline at end of file
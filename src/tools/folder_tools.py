@@ -2,23 +2,23 @@
 Folder tools for Canva MCP Server
 """
 
-import time
-from typing import Dict, Any, Optional
-from mcp.server.fastmcp import FastMCP
+from typing import Any
 
 from ..services.folder_service import FolderService
-from ..utils.logging import log_tool_execution
+from ..utils.logging import instrumented_tool
+from ._pagination import collect_items
+from ._serializers import serialize_folder
+from ._services import service_for
 
-# Import the global config from auth_tools
-from .auth_tools import canva_config
-
-folder_service = FolderService(canva_config)
+def _folder_service() -> FolderService:
+    """Get the folder service for the active configuration"""
+    return service_for(FolderService)
 
+@instrumented_tool()
 async def create_folder(
-    mcp: FastMCP,
     name: str,
-    parent_folder_id: Optional[str] = None
-) -> Dict[str, Any]:
+    parent_folder_id: str | None = None
+) -> dict[str, Any]:
     """
     Create a new folder.
     
@@ -29,25 +29,11 @@ async def create_folder(
     Returns:
         Created folder information
     """
-    start_time = time.time()
-    try:
-        result = await folder_service.create_folder(name, parent_folder_id)
-        duration = time.time() - start_time
-        log_tool_execution("create_folder", True, duration)
-        return {
-            "id": result.id,
-            "name": result.name,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "parent_folder_id": result.parent_folder_id,
-            "item_count": result.item_count
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("create_folder", False, duration, str(e))
-        raise
+    result = await _folder_service().create_folder(name, parent_folder_id)
+    return serialize_folder(result)
 
-async def get_folder(mcp: FastMCP, folder_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def get_folder(folder_id: str) -> dict[str, Any]:
     """
     Get folder metadata.
     
@@ -57,29 +43,14 @@ async def get_folder(mcp: FastMCP, folder_id: str) -> Dict[str, Any]:
     Returns:
         Folder metadata
     """
-    start_time = time.time()
-    try:
-        result = await folder_service.get_folder(folder_id)
-        duration = time.time() - start_time
-        log_tool_execution("get_folder", True, duration)
-        return {
-            "id": result.id,
-            "name": result.name,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "parent_folder_id": result.parent_folder_id,
-            "item_count": result.item_count
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_folder", False, duration, str(e))
-        raise
+    result = await _folder_service().get_folder(folder_id)
+    return serialize_folder(result)
 
+@instrumented_tool()
 async def update_folder(
-    mcp: FastMCP,
     folder_id: str,
-    name: Optional[str] = None
-) -> Dict[str, Any]:
+    name: str | None = None
+) -> dict[str, Any]:
     """
     Update folder metadata.
     
@@ -90,25 +61,11 @@ async def update_folder(
     Returns:
         Updated folder information
     """
-    start_time = time.time()
-    try:
-        result = await folder_service.update_folder(folder_id, name)
-        duration = time.time() - start_time
-        log_tool_execution("update_folder", True, duration)
-        return {
-            "id": result.id,
-            "name": result.name,
-            "created_at": result.created_at.isoformat(),
-            "updated_at": result.updated_at.isoformat(),
-            "parent_folder_id": result.parent_folder_id,
-            "item_count": result.item_count
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("update_folder", False, duration, str(e))
-        raise
+    result = await _folder_service().update_folder(folder_id, name)
+    return serialize_folder(result)
 
-async def delete_folder(mcp: FastMCP, folder_id: str) -> Dict[str, Any]:
+@instrumented_tool()
+async def delete_folder(folder_id: str) -> dict[str, Any]:
     """
     Delete a folder.
     
@@ -118,51 +75,55 @@ async def delete_folder(mcp: FastMCP, folder_id: str) -> Dict[str, Any]:
     Returns:
         Deletion confirmation
     """
-    start_time = time.time()
-    try:
-        result = await folder_service.delete_folder(folder_id)
-        duration = time.time() - start_time
-        log_tool_execution("delete_folder", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("delete_folder", False, duration, str(e))
-        raise
+    return await _folder_service().delete_folder(folder_id)
 
+@instrumented_tool()
 async def list_folder_items(
-    mcp: FastMCP,
     folder_id: str,
     limit: int = 50,
-    page_token: Optional[str] = None
-) -> Dict[str, Any]:
+    page_token: str | None = None,
+    prefetch_pages: int = 0
+) -> dict[str, Any]:
     """
     List the contents of a folder.
     
     Args:
         folder_id: The ID of the folder
-        limit: Maximum number of items to return
+        limit: Maximum number of items to return per page
         page_token: Token for pagination
+        prefetch_pages: Number of following pages to fetch and merge in
         
     Returns:
         Folder contents
     """
-    start_time = time.time()
-    try:
-        result = await folder_service.list_folder_items(folder_id, limit, page_token)
-        duration = time.time() - start_time
-        log_tool_execution("list_folder_items", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("list_folder_items", False, duration, str(e))
-        raise
+    return await _folder_service().list_folder_items(folder_id, limit, page_token, prefetch_pages)
+
+@instrumented_tool()
+async def iter_folder_items(
+    folder_id: str,
+    max_items: int = 200
+) -> dict[str, Any]:
+    """
+    List the contents of a folder across pages, following pagination automatically.
+    
+    The next page is fetched while the current one is processed, and paging
+    stops as soon as max_items items have been collected.
+    
+    Args:
+        folder_id: The ID of the folder
+        max_items: Maximum number of items to return
+        
+    Returns:
+        Folder items under "items", with "truncated" set when more were available
+    """
+    return await collect_items(_folder_service().iter_folder_items(folder_id, max_items=max_items), max_items)
 
+@instrumented_tool()
 async def move_folder_item(
-    mcp: FastMCP,
     item_id: str,
     destination_folder_id: str,
     item_type: str
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """
     Move an item from one folder to another.
     
@@ -174,13 +135,4 @@ async def move_folder_item(
     Returns:
         Move confirmation
     """
-    start_time = time.time()
-    try:
-        result = await folder_service.move_folder_item(item_id, destination_folder_id, item_type)
-        duration = time.time() - start_time
-        log_tool_execution("move_folder_item", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("move_folder_item", False, duration, str(e))
-        raise 
\ No newline at end of file
+    return await _folder_service().move_folder_item(item_id, destination_folder_id, item_type)
\ No newline at end of file
@@ -3,58 +3,47 @@ Utility tools for Canva MCP Server
 """
 
 import time
-from typing import Dict, Any
-from mcp.server.fastmcp import FastMCP
+from types import MappingProxyType
+from typing import Any
 
-from ..utils.logging import log_tool_execution, log_server_startup, log_server_shutdown
+from ..utils.logging import instrumented_tool
 
-def get_server_info(mcp: FastMCP) -> Dict[str, Any]:
+_FEATURES = (
+    "Authentication (OAuth 2.0)",
+    "User Management",
+    "Design Management",
+    "Asset Management",
+    "Folder Management",
+    "Export Operations",
+    "Brand Templates",
+    "Autofill Operations",
+    "Comment Management"
+)
+
+# Constant for the life of the process; only the outer dict is copied per call
+_SERVER_INFO = MappingProxyType({
+    "name": "Canva MCP Server",
+    "version": "1.0.0",
+    "status": "running",
+    "features": _FEATURES
+})
+
+@instrumented_tool()
+def get_server_info() -> dict[str, Any]:
     """
     Get server information and status.
     
     Returns:
         Server information
     """
-    start_time = time.time()
-    try:
-        result = {
-            "name": "Canva MCP Server",
-            "version": "1.0.0",
-            "status": "running",
-            "features": [
-                "Authentication (OAuth 2.0)",
-                "User Management",
-                "Design Management",
-                "Asset Management",
-                "Folder Management",
-                "Export Operations",
-                "Brand Templates",
-                "Autofill Operations",
-                "Comment Management"
-            ]
-        }
-        duration = time.time() - start_time
-        log_tool_execution("get_server_info", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("get_server_info", False, duration, str(e))
-        raise
+    return dict(_SERVER_INFO)
 
-def ping_server(mcp: FastMCP) -> Dict[str, str]:
+@instrumented_tool()
+def ping_server() -> dict[str, Any]:
     """
     Ping the server to check if it's running.
     
     Returns:
         Ping response
     """
-    start_time = time.time()
-    try:
-        result = {"message": "pong", "timestamp": time.time()}
-        duration = time.time() - start_time
-        log_tool_execution("ping_server", True, duration)
-        return result
-    except Exception as e:
-        duration = time.time() - start_time
-        log_tool_execution("ping_server", False, duration, str(e))
-        raise 
\ No newline at end of file
+    return {"message": "pong", "timestamp": time.time()}
\ No newline at end of file
@@ -3,42 +3,47 @@ Configuration utilities for Canva MCP Server
 """
 
 import os
-from typing import Optional
+from dataclasses import dataclass, field
+from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from the project's .env file, if there is one;
+# DOTENV_SKIP=1 skips it where the variables are already injected
+_ENV_FILE = Path(__file__).resolve().parents[2] / ".env"
+if os.getenv("DOTENV_SKIP") != "1" and _ENV_FILE.exists():
+    load_dotenv(_ENV_FILE)
 
+def _env(name: str, default: str = ""):
+    """Field default read from an environment variable when the config is built"""
+    return field(default_factory=lambda: os.getenv(name, default))
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration class for the Canva MCP Server"""
+    """Configuration for the Canva MCP Server, resolved from the environment"""
     
     # Canva API Configuration
-    CANVA_CLIENT_ID: str = os.getenv("CANVA_CLIENT_ID", "")
-    CANVA_CLIENT_SECRET: str = os.getenv("CANVA_CLIENT_SECRET", "")
-    CANVA_REDIRECT_URI: str = os.getenv("CANVA_REDIRECT_URI", "")
+    canva_client_id: str = _env("CANVA_CLIENT_ID")
+    canva_client_secret: str = _env("CANVA_CLIENT_SECRET")
+    canva_redirect_uri: str = _env("CANVA_REDIRECT_URI")
     
     # Server Configuration
-    MCP_SERVER_HOST: str = os.getenv("MCP_SERVER_HOST", "localhost")
-    MCP_SERVER_PORT: int = int(os.getenv("MCP_SERVER_PORT", "8000"))
+    mcp_server_host: str = _env("MCP_SERVER_HOST", "localhost")
+    mcp_server_port: int = field(default_factory=lambda: int(os.getenv("MCP_SERVER_PORT", "8000")))
     
     # Logging Configuration
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE: str = os.getenv("LOG_FILE", "canva_mcp_server.log")
-    LOG_ERROR_FILE: str = os.getenv("LOG_ERROR_FILE", "canva_mcp_server_errors.log")
+    log_level: str = _env("LOG_LEVEL", "INFO")
+    log_file: str = _env("LOG_FILE", "canva_mcp_server.log")
+    log_error_file: str = _env("LOG_ERROR_FILE", "canva_mcp_server_errors.log")
     
-    @classmethod
-    def validate(cls) -> bool:
+    def validate(self) -> bool:
         """Validate that all required configuration is present"""
-        required_vars = [
-            "CANVA_CLIENT_ID",
-            "CANVA_CLIENT_SECRET", 
-            "CANVA_REDIRECT_URI"
-        ]
+        required_vars = (
+            ("CANVA_CLIENT_ID", self.canva_client_id),
+            ("CANVA_CLIENT_SECRET", self.canva_client_secret),
+            ("CANVA_REDIRECT_URI", self.canva_redirect_uri)
+        )
         
-        missing_vars = []
-        for var in required_vars:
-            if not getattr(cls, var):
-                missing_vars.append(var)
+        missing_vars = [name for name, value in required_vars if not value]
         
         if missing_vars:
             print(f"Missing required environment variables: {', '.join(missing_vars)}")
@@ -47,14 +52,16 @@ class Config:
         
         return True
     
-    @classmethod
-    def get_config_summary(cls) -> dict:
+    def get_config_summary(self) -> dict:
         """Get a summary of the current configuration"""
         return {
-            "client_id_configured": bool(cls.CANVA_CLIENT_ID),
-            "client_secret_configured": bool(cls.CANVA_CLIENT_SECRET),
-            "redirect_uri_configured": bool(cls.CANVA_REDIRECT_URI),
-            "server_host": cls.MCP_SERVER_HOST,
-            "server_port": cls.MCP_SERVER_PORT,
-            "log_level": cls.LOG_LEVEL
-        }
\ No newline at end of file
+            "client_id_configured": bool(self.canva_client_id),
+            "client_secret_configured": bool(self.canva_client_secret),
+            "redirect_uri_configured": bool(self.canva_redirect_uri),
+            "server_host": self.mcp_server_host,
+            "server_port": self.mcp_server_port,
+            "log_level": self.log_level
+        }
+
+# Configuration resolved once at import
+CONFIG = Config()
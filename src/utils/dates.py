@@ -0,0 +1,32 @@
+"""
+Date parsing utilities for Canva API responses
+Uses ciso8601 when it is installed and falls back to the standard library
+"""
+
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover - optional dependency
+    ciso8601 = None
+
+if ciso8601 is not None:
+    # C parser that also accepts a trailing 'Z' for UTC
+    parse_iso = ciso8601.parse_datetime
+elif sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' natively from Python 3.11
+    parse_iso = datetime.fromisoformat
+else:
+    @lru_cache(maxsize=4096)
+    def parse_iso(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC"""
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.fromisoformat(value)
+
+def parse_iso_opt(value: Optional[str]) -> Optional[datetime]:
+    """Parse an optional ISO 8601 timestamp, returning None if missing"""
+    return parse_iso(value) if value else None
@@ -0,0 +1,20 @@
+"""
+Error types for Canva MCP Server
+"""
+
+from typing import Any
+
+class CanvaAPIError(Exception):
+    """Error response from the Canva API"""
+    
+    __slots__ = ("status", "body")
+    
+    def __init__(self, status: int, body: Any):
+        super().__init__(status, body)
+        self.status = status
+        self.body = body
+    
+    def __str__(self) -> str:
+        # Formatted only when printed, so callers that just inspect
+        # status never pay for rendering the body
+        return f"Canva API error: {self.status} - {self.body}"
@@ -1,38 +1,22 @@
+import atexit
+import functools
+import inspect
 import logging
+import queue
 import sys
 import os
+import time
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from typing import Optional
-
-# Configure basic logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('canva_mcp_server.log')
-    ]
-)
+from typing import Optional, Callable
 
-def setup_logger(name: str = "canva_mcp_server", level: Optional[str] = None) -> logging.Logger:
-    """
-    Set up a logger with the specified name and level.
-    
-    Args:
-        name: Name of the logger
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        
-    Returns:
-        Configured logger instance
-    """
-    logger = logging.getLogger(name)
-    
-    # Set log level
-    if level:
-        log_level = getattr(logging, level.upper(), logging.INFO)
-        logger.setLevel(log_level)
-    
-    # Create formatters
+# Child loggers propagate to the "canva_mcp_server" logger set up below
+_API_LOG = logging.getLogger("canva_mcp_server.api")
+_OAUTH_LOG = logging.getLogger("canva_mcp_server.oauth")
+_TOOLS_LOG = logging.getLogger("canva_mcp_server.tools")
+
+def _create_handlers() -> tuple:
+    """Create the console, log file and error file handlers"""
     detailed_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
     )
@@ -56,15 +40,84 @@ def setup_logger(name: str = "canva_mcp_server", level: Optional[str] = None) ->
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
     
-    # Clear existing handlers and add new ones
-    logger.handlers.clear()
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    logger.addHandler(error_handler)
+    return console_handler, file_handler, error_handler
+
+# Records are queued by the logging call and written by a background thread,
+# so tool coroutines never block the event loop on console or file I/O
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handlers = _create_handlers()
+_log_listener: Optional[QueueListener] = QueueListener(
+    _log_queue, *_log_handlers, respect_handler_level=True
+)
+_log_listener.start()
+
+# Loggers set up by setup_logger, with the QueueHandler attached to each
+_queued_loggers: list[tuple[logging.Logger, QueueHandler]] = []
+
+def _stop_log_listener():
+    """
+    Write out any queued records and stop the background log writer.
     
+    The loggers are switched to writing through the handlers directly, so
+    records logged during the rest of shutdown are not lost in the queue.
+    """
+    global _log_listener
+    if _log_listener is None:
+        return
+    
+    _log_listener.stop()
+    _log_listener = None
+    for logger, queue_handler in _queued_loggers:
+        logger.removeHandler(queue_handler)
+        for handler in _log_handlers:
+            logger.addHandler(handler)
+    _queued_loggers.clear()
+
+atexit.register(_stop_log_listener)
+
+def setup_logger(name: str = "canva_mcp_server", level: Optional[str] = None) -> logging.Logger:
+    """
+    Set up a logger with the specified name and level.
+    
+    Args:
+        name: Name of the logger
+        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        
+    Returns:
+        Configured logger instance
+    """
+    logger = logging.getLogger(name)
+    
+    # Set log level
+    if level:
+        logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    elif logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    
+    # Already set up; the handlers are shared, so never attach them twice
+    if logger.handlers:
+        return logger
+    
+    if _log_listener is None:
+        # Shutting down; write directly
+        for handler in _log_handlers:
+            logger.addHandler(handler)
+    else:
+        queue_handler = QueueHandler(_log_queue)
+        logger.addHandler(queue_handler)
+        _queued_loggers.append((logger, queue_handler))
     return logger
 
-def log_api_request(method: str, endpoint: str, status_code: int, duration: float):
+def api_logging_enabled() -> bool:
+    """
+    Whether log_api_request emits records for successful (2xx) requests.
+    
+    Redirect and failure records are logged at WARNING and ERROR, so they
+    can be emitted even when this is false.
+    """
+    return _API_LOG.isEnabledFor(logging.INFO)
+
+def log_api_request(method: str, endpoint: str, status_code: int, duration: Optional[float] = None):
     """
     Log API request details.
     
@@ -72,16 +125,24 @@ def log_api_request(method: str, endpoint: str, status_code: int, duration: floa
         method: HTTP method
         endpoint: API endpoint
         status_code: HTTP status code
-        duration: Request duration in seconds
+        duration: Request duration in seconds (omitted when not measured)
     """
-    logger = logging.getLogger("canva_mcp_server.api")
-    
+    # Arguments are only formatted when the record is actually emitted
     if status_code >= 400:
-        logger.error(f"API Request failed: {method} {endpoint} - Status: {status_code} - Duration: {duration:.3f}s")
+        level, outcome = logging.ERROR, "failed"
     elif status_code >= 300:
-        logger.warning(f"API Request redirected: {method} {endpoint} - Status: {status_code} - Duration: {duration:.3f}s")
+        level, outcome = logging.WARNING, "redirected"
+    else:
+        level, outcome = logging.INFO, "successful"
+    
+    if duration is None:
+        _API_LOG.log(level, "API Request %s: %s %s - Status: %s", outcome, method, endpoint, status_code)
     else:
-        logger.info(f"API Request successful: {method} {endpoint} - Status: {status_code} - Duration: {duration:.3f}s")
+        _API_LOG.log(
+            level,
+            "API Request %s: %s %s - Status: %s - Duration: %.3fs",
+            outcome, method, endpoint, status_code, duration
+        )
 
 def log_oauth_flow(step: str, details: dict = None):
     """
@@ -91,12 +152,10 @@ def log_oauth_flow(step: str, details: dict = None):
         step: OAuth step description
         details: Additional details (optional)
     """
-    logger = logging.getLogger("canva_mcp_server.oauth")
-    
     if details:
-        logger.info(f"OAuth Flow - {step}: {details}")
+        _OAUTH_LOG.info("OAuth Flow - %s: %s", step, details)
     else:
-        logger.info(f"OAuth Flow - {step}")
+        _OAUTH_LOG.info("OAuth Flow - %s", step)
 
 def log_tool_execution(tool_name: str, success: bool, duration: float, error: str = None):
     """
@@ -108,28 +167,74 @@ def log_tool_execution(tool_name: str, success: bool, duration: float, error: st
         duration: Execution duration in seconds
         error: Error message if execution failed
     """
-    logger = logging.getLogger("canva_mcp_server.tools")
-    
+    # Arguments are only formatted when the record is actually emitted
     if success:
-        logger.info(f"Tool executed successfully: {tool_name} - Duration: {duration:.3f}s")
+        _TOOLS_LOG.info("Tool executed successfully: %s - Duration: %.3fs", tool_name, duration)
     else:
-        logger.error(f"Tool execution failed: {tool_name} - Duration: {duration:.3f}s - Error: {error}")
+        _TOOLS_LOG.error("Tool execution failed: %s - Duration: %.3fs - Error: %s", tool_name, duration, error)
+
+def instrumented_tool(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorator logging the duration and outcome of every call to a tool.
+    
+    Works for both sync and async tools; exceptions are logged and re-raised.
+    
+    Args:
+        name: Tool name used in the log (defaults to the function name)
+        
+    Returns:
+        Decorator wrapping the tool function
+    """
+    def decorator(func: Callable) -> Callable:
+        tool_name = name or func.__name__
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                start_time = time.perf_counter_ns()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    log_tool_execution(tool_name, False, (time.perf_counter_ns() - start_time) / 1e9, str(e))
+                    raise
+                log_tool_execution(tool_name, True, (time.perf_counter_ns() - start_time) / 1e9)
+                return result
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start_time = time.perf_counter_ns()
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    log_tool_execution(tool_name, False, (time.perf_counter_ns() - start_time) / 1e9, str(e))
+                    raise
+                log_tool_execution(tool_name, True, (time.perf_counter_ns() - start_time) / 1e9)
+                return result
+        
+        return wrapper
+    return decorator
+
+_config_checked = False
+
+def _set_label(value: Optional[str]) -> str:
+    """Status label for a configuration variable"""
+    return '✅ Set' if value else '❌ Not set'
 
 def log_configuration_check():
     """
-    Log configuration status.
+    Log configuration status, once per process.
     """
-    logger = logging.getLogger("canva_mcp_server.config")
-    
-    # Check environment variables
-    client_id = os.getenv("CANVA_CLIENT_ID")
-    client_secret = os.getenv("CANVA_CLIENT_SECRET")
-    redirect_uri = os.getenv("CANVA_REDIRECT_URI")
+    global _config_checked
+    if _config_checked:
+        return
+    _config_checked = True
     
-    logger.info("Configuration check:")
-    logger.info(f"  - CANVA_CLIENT_ID: {'✅ Set' if client_id else '❌ Not set'}")
-    logger.info(f"  - CANVA_CLIENT_SECRET: {'✅ Set' if client_secret else '❌ Not set'}")
-    logger.info(f"  - CANVA_REDIRECT_URI: {'✅ Set' if redirect_uri else '❌ Not set'}")
+    logging.getLogger("canva_mcp_server.config").info(
+        "Configuration check: CANVA_CLIENT_ID: %s - CANVA_CLIENT_SECRET: %s - CANVA_REDIRECT_URI: %s",
+        _set_label(os.getenv("CANVA_CLIENT_ID")),
+        _set_label(os.getenv("CANVA_CLIENT_SECRET")),
+        _set_label(os.getenv("CANVA_REDIRECT_URI"))
+    )
 
 def log_server_startup():
     """
@@ -157,6 +262,8 @@ def log_server_shutdown():
     logger.info("Canva MCP Server Shutting Down")
     logger.info("=" * 50)
     logger.info(f"Shutdown time: {datetime.now().isoformat()}")
+    
+    _stop_log_listener()
 
 # Create default logger instance
 logger = setup_logger()
@@ -164,6 +271,7 @@ logger = setup_logger()
 # Export commonly used functions
 __all__ = [
     'setup_logger',
+    'api_logging_enabled',
     'log_api_request',
     'log_oauth_flow',
     'log_tool_execution',
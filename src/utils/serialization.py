@@ -0,0 +1,24 @@
+"""
+JSON serialization utilities for Canva MCP Server
+Uses orjson when it is installed and falls back to the standard library
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    import json
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(data: Any) -> bytes:
+    """Encode a value as a compact UTF-8 JSON document"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
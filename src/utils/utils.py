@@ -2,13 +2,15 @@ import base64
 import hashlib
 import secrets
 from typing import Optional, Dict, Any
-import httpx
 
-from src.utils.config import canva_config 
+from src.config_registry import get_config
+from src.utils.errors import CanvaAPIError
+from src.utils.serialization import json_loads
+from src.services.http_client import get_shared_client
 
 def generate_code_verifier() -> str:
     """Generate a code verifier for PKCE"""
-    return base64.urlsafe_b64encode(secrets.token_bytes(96)).decode('utf-8').rstrip('=')
+    return secrets.token_urlsafe(96)
 
 def generate_code_challenge(code_verifier: str) -> str:
     """Generate a code challenge from code verifier"""
@@ -17,7 +19,7 @@ def generate_code_challenge(code_verifier: str) -> str:
 
 def generate_state() -> str:
     """Generate a state parameter for OAuth"""
-    return base64.urlsafe_b64encode(secrets.token_bytes(96)).decode('utf-8').rstrip('=')
+    return secrets.token_urlsafe(96)
 
 async def make_canva_request(
     method: str, 
@@ -30,22 +32,22 @@ async def make_canva_request(
     if headers is None:
         headers = {}
     
+    canva_config = get_config()
     if canva_config.access_token:
         headers['Authorization'] = f'Bearer {canva_config.access_token}'
     
-    url = f"{canva_config.api_base}{endpoint}"
+    # The shared client pools connections to the Canva API base URL
+    response = await get_shared_client().request(
+        method=method,
+        url=endpoint,
+        headers=headers,
+        json=data if data else None,
+        params=params
+    )
     
-    async with httpx.AsyncClient() as client:
-        response = await client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=data if data else None,
-            params=params
-        )
-        
-        if response.status_code >= 400:
-            error_detail = response.json() if response.content else {}
-            raise Exception(f"Canva API error: {response.status_code} - {error_detail}")
-        
-        return response.json() if response.content else {}
+    # Parsed once for both outcomes; 204s and other empty bodies skip decoding
+    body = json_loads(response.content) if response.status_code != 204 and response.content else {}
+    if response.status_code >= 400:
+        raise CanvaAPIError(response.status_code, body)
+    
+    return body